@@ -0,0 +1,368 @@
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LABS = ("laba1", "laba3", "laba4")
+LABA4_SCHEDULERS = ("rr", "mlfq", "srtf", "priority", "cfs")
+LABA4_ALLOCATORS = ("counter", "first_fit", "best_fit", "next_fit", "worst_fit", "buddy", "slab", "paging")
+
+# Размеры задач: полный прогон и быстрый (--quick) для проверки в CI
+SIZES = {
+    "full": {"ticks": 200_000, "processes": 10, "scheduler": 20_000, "list_scheduler": 5_000,
+             "memory": 5_000, "process_manager": 100_000, "stats": (10, 100, 1_000, 10_000)},
+    "quick": {"ticks": 20_000, "processes": 10, "scheduler": 2_000, "list_scheduler": 1_000,
+              "memory": 1_000, "process_manager": 10_000, "stats": (10, 100, 1_000)},
+}
+
+
+# ---------------------------------------------------------------------------
+# Замеры внутри одной лабораторной: выполняются в отдельном процессе с cwd = каталог лабораторной,
+# потому что все три используют пакет src
+# ---------------------------------------------------------------------------
+
+class _TickLimit:
+    # Подменяет модуль time в src.os: ожидание не спит, а сдвигает виртуальные часы monotonic,
+    # и система останавливается, когда выполнено нужное число тактов (без tick_count - по числу ожиданий)
+    def __init__(self, os_emulator, ticks: int):
+        self.os_emulator = os_emulator
+        self.ticks: int = ticks
+        self.count: int = 0
+        self.now: float = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.count += 1
+        if getattr(self.os_emulator, "tick_count", self.count) >= self.ticks:
+            self.os_emulator.shutdown()
+
+
+def _lab_config(**overrides) -> Dict:
+    with open("config.json") as f:
+        config = json.load(f)
+    config.update(overrides)
+    return config
+
+
+def _new_process(process_class, size: int):
+    if "program_length" in inspect.signature(process_class).parameters:
+        return process_class(size=size, program_length=30)
+    return process_class(size=size)
+
+
+def _best(repeats: int, measure: Callable[[], float]) -> float:
+    return min(measure() for _ in range(repeats))
+
+
+def bench_run(sizes: Dict, repeats: int) -> Dict[str, float]:
+    import src.os as os_module
+
+    ticks = sizes["ticks"]
+    # Программы длиннее прогона: процессы не завершаются, и все такты выполняются под нагрузкой.
+    # Скорость 1000 Гц по виртуальным часам: ровно одно ожидание на такт
+    config = _lab_config(max_processes=sizes["processes"], memory=1 << 30, program_length=ticks,
+                         initial_speed_hz=1000.0)
+
+    def measure() -> float:
+        os_emulator = os_module.OperatingSystem(config)
+        for _ in range(sizes["processes"]):
+            os_emulator.create_new_process(128)
+
+        real_time = os_module.time
+        limit = _TickLimit(os_emulator, ticks)
+        patched_time = SimpleNamespace(**{name: getattr(time, name) for name in dir(time) if not name.startswith("_")})
+        patched_time.sleep = limit.sleep
+        patched_time.monotonic = limit.monotonic
+        os_module.time = patched_time
+        try:
+            started = time.perf_counter()
+            os_emulator.boot()
+            return time.perf_counter() - started
+        finally:
+            os_module.time = real_time
+
+    results = {"run.ticks_per_s": ticks / _best(repeats, measure)}
+
+    if hasattr(os_module.OperatingSystem, "run_for"):
+        workload_config = _lab_config(seed=0, max_processes=1000, memory=1 << 20,
+                                      workload={"arrival": {"process": "poisson", "rate": 0.05}})
+        for engine in ("tick", "event"):
+            def measure_engine() -> float:
+                os_emulator = os_module.OperatingSystem(workload_config)
+                started = time.perf_counter()
+                os_emulator.run_for(ticks, event_driven=engine == "event")
+                return time.perf_counter() - started
+
+            results[f"run_for.{engine}.ticks_per_s"] = ticks / _best(repeats, measure_engine)
+    return results
+
+
+def _scheduler_ops(prefix: str, make_scheduler: Callable, processes: List, repeats: int) -> Dict[str, float]:
+    n = len(processes)
+    pids = [process.pid for process in processes]
+    random.Random(0).shuffle(pids)
+    timings = {"add": [], "remove": [], "get": []}
+
+    for _ in range(repeats):
+        for process in processes:
+            process.state = type(process.state).NEW
+        scheduler = make_scheduler()
+
+        started = time.perf_counter()
+        for process in processes:
+            scheduler.add_process(process)
+        timings["add"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for pid in pids[:n // 2]:
+            scheduler.remove_process(pid)
+        timings["remove"].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for _ in range(n - n // 2):
+            scheduler.get_next_process()
+        timings["get"].append(time.perf_counter() - started)
+
+    counts = {"add": n, "remove": n // 2, "get": n - n // 2}
+    return {f"{prefix}.{op}.ops_per_s": counts[op] / min(elapsed) for op, elapsed in timings.items()}
+
+
+def bench_scheduler(sizes: Dict, repeats: int) -> Dict[str, float]:
+    from src.core.process import Process
+    import src.services.scheduler as scheduler_module
+
+    if hasattr(scheduler_module, "create_scheduler"):
+        processes = [_new_process(Process, 1) for _ in range(sizes["scheduler"])]
+        results = {}
+        for name in LABA4_SCHEDULERS:
+            config = _lab_config(scheduler=name)
+            results.update(_scheduler_ops(f"scheduler.{name}", lambda: scheduler_module.create_scheduler(config),
+                                          processes, repeats))
+        return results
+
+    # В ранних версиях очередь - deque с линейным удалением, поэтому процессов меньше
+    processes = [_new_process(Process, 1) for _ in range(sizes["list_scheduler"])]
+    return _scheduler_ops("scheduler", scheduler_module.Scheduler, processes, repeats)
+
+
+def _memory_ops(prefix: str, make_manager: Callable, sizes_list: List[int], repeats: int) -> Dict[str, float]:
+    n = len(sizes_list)
+    order = list(range(n))
+    random.Random(0).shuffle(order)
+    allocate_times, free_times = [], []
+
+    for _ in range(repeats):
+        manager = make_manager()
+        started = time.perf_counter()
+        for pid, size in enumerate(sizes_list):
+            manager.allocate(pid, size)
+        allocate_times.append(time.perf_counter() - started)
+
+        # Освобождение в случайном порядке - списки свободных участков фрагментируются
+        started = time.perf_counter()
+        for pid in order:
+            manager.free(pid)
+        free_times.append(time.perf_counter() - started)
+
+    return {f"{prefix}.allocate.ops_per_s": n / min(allocate_times), f"{prefix}.free.ops_per_s": n / min(free_times)}
+
+
+def bench_memory(sizes: Dict, repeats: int) -> Dict[str, float]:
+    import src.core.memory as memory_module
+
+    rng = random.Random(0)
+    sizes_list = [rng.randint(16, 512) for _ in range(sizes["memory"])]
+    # С запасом на округление у buddy и слябов
+    total = sum(sizes_list) * 2
+
+    if hasattr(memory_module, "create_memory_manager"):
+        results = {}
+        for allocator in LABA4_ALLOCATORS:
+            config = _lab_config(memory=total, memory_allocator=allocator)
+            results.update(_memory_ops(f"memory.{allocator}", lambda: memory_module.create_memory_manager(config),
+                                       sizes_list, repeats))
+        return results
+
+    return _memory_ops("memory", lambda: memory_module.MemoryManager(total_size=total), sizes_list, repeats)
+
+
+def bench_process_manager(sizes: Dict, repeats: int) -> Dict[str, float]:
+    from src.services.process_manager import ProcessManager
+
+    n = sizes["process_manager"]
+    create_times, remove_times = [], []
+    for _ in range(repeats):
+        manager = ProcessManager(max_processes=n)
+        create = getattr(manager, "create_and_register_process", None) or manager.create_process
+        arguments = {"size": 1}
+        if "program_length" in inspect.signature(create).parameters:
+            arguments["program_length"] = 30
+
+        started = time.perf_counter()
+        for _ in range(n):
+            create(**arguments)
+        create_times.append(time.perf_counter() - started)
+
+        pids = list(manager.process_table)
+        started = time.perf_counter()
+        for pid in pids:
+            manager.remove_process(pid)
+        remove_times.append(time.perf_counter() - started)
+
+    return {"process_manager.create.ops_per_s": n / min(create_times),
+            "process_manager.remove.ops_per_s": n / min(remove_times)}
+
+
+def bench_stats(sizes: Dict, repeats: int) -> Dict[str, float]:
+    from src.os import OperatingSystem
+
+    results = {}
+    for count in sizes["stats"]:
+        os_emulator = OperatingSystem(_lab_config(max_processes=count, memory=1 << 30))
+        for _ in range(count):
+            os_emulator.create_new_process(16)
+
+        def measure() -> float:
+            calls = 0
+            started = time.perf_counter()
+            while True:
+                os_emulator.get_system_stats()
+                calls += 1
+                elapsed = time.perf_counter() - started
+                if elapsed >= 0.05:
+                    return elapsed / calls
+
+        results[f"get_system_stats.{count}.us_per_call"] = _best(repeats, measure) * 1e6
+    return results
+
+
+BENCHMARKS = {
+    "run": bench_run,
+    "scheduler": bench_scheduler,
+    "memory": bench_memory,
+    "process_manager": bench_process_manager,
+    "stats": bench_stats,
+}
+
+
+def run_worker(lab: str, selected: List[str], sizes: Dict, repeats: int) -> Dict[str, float]:
+    sys.path.insert(0, os.getcwd())
+    results = {}
+    for name in selected:
+        # Эмуляторы печатают сообщения загрузки - в вывод рабочего процесса идёт только JSON
+        with contextlib.redirect_stdout(io.StringIO()):
+            measured = BENCHMARKS[name](sizes, repeats)
+        results.update({f"{lab}.{metric}": round(value, 3) for metric, value in measured.items()})
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Запуск по лабораторным, сохранение результатов и сравнение с базовыми
+# ---------------------------------------------------------------------------
+
+def run_suite(labs: List[str], selected: List[str], quick: bool, repeats: int) -> Dict:
+    results = {}
+    for lab in labs:
+        print(f"{lab}: {', '.join(selected)}...", file=sys.stderr)
+        command = [sys.executable, os.path.abspath(__file__), "--worker", lab, "--repeats", str(repeats),
+                   "--only", *selected]
+        if quick:
+            command.append("--quick")
+        completed = subprocess.run(command, cwd=os.path.join(ROOT, lab), capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Замеры {lab} завершились с ошибкой:\n{completed.stderr}")
+        results.update(json.loads(completed.stdout))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "quick": quick,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def _higher_is_better(metric: str) -> bool:
+    return not metric.endswith("us_per_call")
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    # Регрессия - ухудшение больше порога в нужную для метрики сторону
+    regressions = []
+    base_results = baseline["results"]
+    if current["meta"]["quick"] != baseline["meta"].get("quick"):
+        print("  Внимание: размеры задач (--quick) отличаются от базовых - сравнение неточно")
+    for metric, value in sorted(current["results"].items()):
+        base = base_results.get(metric)
+        if not base:
+            print(f"  {metric:<55} {value:>14,.1f}  (нет в базовых)")
+            continue
+
+        change = value / base - 1 if _higher_is_better(metric) else base / value - 1
+        regressed = change < -threshold
+        mark = "РЕГРЕССИЯ" if regressed else ""
+        print(f"  {metric:<55} {value:>14,.1f} {base:>14,.1f} {change:>+8.1%}  {mark}")
+        if regressed:
+            regressions.append(metric)
+
+    missing = set(base_results) - set(current["results"])
+    if missing:
+        print(f"  Не измерено в этом запуске: {len(missing)} метрик базовых результатов")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Набор бенчмарков эмуляторов laba1/laba3/laba4")
+    parser.add_argument("--labs", nargs="+", choices=LABS, default=list(LABS))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help="Запустить только указанные группы замеров.")
+    parser.add_argument("--quick", action="store_true", help="Уменьшенные размеры задач.")
+    parser.add_argument("--repeats", type=int, default=3, help="Повторов на замер (берётся лучший).")
+    parser.add_argument("--out", default="bench_results.json", help="JSON-файл с результатами.")
+    parser.add_argument("--baseline", help="Сравнить с сохранёнными результатами.")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Допустимое ухудшение (доля), по умолчанию 0.15.")
+    parser.add_argument("--worker", choices=LABS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sizes = SIZES["quick" if args.quick else "full"]
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.only, sizes, args.repeats)))
+        return
+
+    report = run_suite(args.labs, args.only, args.quick, args.repeats)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Результаты: {len(report['results'])} метрик -> {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"Сравнение с {args.baseline} (порог {args.threshold:.0%}):")
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"Регрессий: {len(regressions)}")
+            sys.exit(1)
+        print("Регрессий нет.")
+    else:
+        for metric, value in sorted(report["results"].items()):
+            print(f"  {metric:<55} {value:>14,.1f}")
+
+
+if __name__ == "__main__":
+    main()
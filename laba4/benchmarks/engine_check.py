@@ -0,0 +1,80 @@
+import argparse
+import json
+import sys
+from itertools import count
+
+from src.core.process import Process
+from src.os import OperatingSystem
+
+# Поля процесса, которые обязаны совпадать у обоих движков
+PROCESS_FIELDS = ("pid", "state", "program_counter", "ticks_worked_in_quantum", "io_time_remaining",
+                  "cpu_ticks", "io_wait_ticks", "ready_wait_ticks", "memory_wait_ticks")
+
+# Планировщики, распределители памяти, устройства, подкачка и несколько ядер
+CONFIGS = [
+    dict(io_command_probability=0.5, io_duration=15),
+    dict(scheduler="mlfq", io_command_probability=0.3),
+    dict(scheduler="srtf", workload={"arrival": {"process": "poisson", "rate": 0.05},
+                                     "program_length": {"dist": "uniform", "min": 5, "max": 60}}),
+    dict(scheduler="cfs", workload={"arrival": {"process": "poisson", "rate": 0.05}}),
+    dict(scheduler="priority", workload={"arrival": {"process": "bursty", "rate": 0.01},
+                                         "priority": {"dist": "uniform", "min": 0, "max": 5}}),
+    dict(memory_allocator="best_fit", workload={"arrival": {"process": "poisson", "rate": 0.1},
+                                                "size": {"dist": "uniform", "min": 32, "max": 300}}),
+    dict(memory_allocator="buddy", workload={"arrival": {"process": "poisson", "rate": 0.1},
+                                             "size": {"dist": "uniform", "min": 32, "max": 300}}),
+    dict(memory_allocator="slab", workload={"arrival": {"process": "poisson", "rate": 0.1}}),
+    dict(memory_allocator="paging", scheduler="cfs", workload={"arrival": {"process": "poisson", "rate": 0.05}}),
+    dict(swap_size=2048, max_processes=40, io_duration=60, workload={"arrival": {"process": "poisson", "rate": 0.2}}),
+    dict(swap_size=4096, max_processes=60, scheduler="cfs", cpu_count=2, io_duration=80,
+         workload={"arrival": {"process": "poisson", "rate": 0.3}}),
+    dict(cpu_count=4, max_processes=40, workload={"arrival": {"process": "poisson", "rate": 0.3}}),
+    dict(io_devices={"disk": {"scheduler": "look"}, "network": {}}, scheduler="mlfq",
+         workload={"arrival": {"process": "poisson", "rate": 0.05}}),
+]
+
+
+def _process_row(process: Process) -> tuple:
+    return tuple(getattr(process, field) for field in PROCESS_FIELDS)
+
+
+def run_engine(config: dict, ticks: int, event_driven: bool) -> dict:
+    # Номера процессов общие для всех систем - каждый запуск начинается с нуля
+    Process._id_counter = count(0)
+    stats = OperatingSystem(dict(config)).run_for(ticks, event_driven=event_driven)
+    stats["all_processes"] = sorted(_process_row(process) for process in stats["all_processes"])
+    next_task = stats["next_task"]
+    stats["next_task"] = _process_row(next_task) if next_task is not None else None
+    return json.loads(json.dumps(stats, default=str))
+
+
+def compare(config: dict, ticks: int) -> list:
+    tick_stats = run_engine(config, ticks, event_driven=False)
+    event_stats = run_engine(config, ticks, event_driven=True)
+    return [key for key in tick_stats if tick_stats[key] != event_stats.get(key)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение потактового и событийного движков по get_system_stats()")
+    parser.add_argument("--ticks", type=int, nargs="+", default=[997, 20_000])
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        base_config = json.load(f)
+
+    mismatches = 0
+    for index, overrides in enumerate(CONFIGS):
+        config = dict(base_config, **overrides, seed=args.seed + index)
+        for ticks in args.ticks:
+            keys = compare(config, ticks)
+            if keys:
+                mismatches += 1
+                print(f"Расхождение: {json.dumps(overrides, ensure_ascii=False)}, {ticks} тактов: {', '.join(keys)}")
+    print(f"Проверено конфигураций: {len(CONFIGS) * len(args.ticks)}, расхождений: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from src.core.process import Process
+from src.os import OperatingSystem
+from src.services.workload import Workload
+
+
+def measure_memory(n: int, program_length: int, seed: int) -> None:
+    # Программы генерируются заранее: в замер попадает только сам процесс и его поля
+    workload = Workload({"program_length": program_length}, seed)
+    programs = [workload.compile_program(program_length) for _ in range(min(n, 1000))]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    processes = [Process(size=128, program_length=program_length, program=programs[i % len(programs)])
+                 for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    list_bytes = sys.getsizeof(processes)
+    per_process = (after - before - list_bytes) / n
+    print(f"Память: {n} процессов, {per_process:.0f} байт на процесс "
+          f"(объект {sys.getsizeof(processes[0])} байт, __dict__: {hasattr(processes[0], '__dict__')})")
+
+
+def measure_ticks(config: dict, ticks: int, repeats: int) -> None:
+    for engine in ("tick", "event"):
+        best = float("inf")
+        for _ in range(repeats):
+            os_emulator = OperatingSystem(dict(config))
+            started = time.perf_counter()
+            os_emulator.run_for(ticks, event_driven=engine == "event")
+            best = min(best, time.perf_counter() - started)
+        print(f"Такты ({engine}): {ticks} за {best:.3f} с ({ticks / best:,.0f} такт/сек)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Память на процесс и пропускная способность тактов")
+    parser.add_argument("-n", type=int, default=200_000, help="Количество процессов для замера памяти.")
+    parser.add_argument("--program-length", type=int, default=30)
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = json.load(f)
+    # Непрерывный поток задач с большой таблицей процессов - переходы состояний на каждом такте
+    config.update(seed=args.seed, max_processes=1000, memory=1 << 20, quantum_length=2,
+                  workload={"arrival": {"process": "poisson", "rate": 0.1}})
+
+    measure_memory(args.n, args.program_length, args.seed)
+    measure_ticks(config, args.ticks, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import random
+import time
+
+from src.core.process import Process
+from src.services.scheduler import Scheduler
+
+
+def _measure(label: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{label:<10} {count:>8} оп. за {elapsed:.4f} с  ({rate:,.0f} оп/с)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Микробенчмарк очереди готовых процессов")
+    parser.add_argument("-n", type=int, default=100_000, help="Количество процессов.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    n = args.n
+    processes = [Process(size=1, program_length=1) for _ in range(n)]
+    pids = [p.pid for p in processes]
+    random.Random(args.seed).shuffle(pids)
+    scheduler = Scheduler()
+
+    def add_all():
+        for process in processes:
+            scheduler.add_process(process)
+
+    def contains_all():
+        for pid in pids:
+            pid in scheduler
+
+    def requeue_half():
+        for pid in pids[: n // 2]:
+            scheduler.move_to_end(pid)
+
+    def remove_half():
+        for pid in pids[: n // 2]:
+            scheduler.remove_process(pid)
+
+    def pop_rest():
+        while scheduler.get_next_process() is not None:
+            pass
+
+    print(f"Scheduler: {n} процессов")
+    _measure("add", n, add_all)
+    _measure("contains", n, contains_all)
+    _measure("requeue", n // 2, requeue_half)
+    _measure("remove", n // 2, remove_half)
+    _measure("pop", n - n // 2, pop_rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
+import argparse
+import cProfile
 import json
 import os
+import pstats
+import time
 from src.os import OperatingSystem
-from src.ui import CLI
+from src.runtime import AsyncRuntime
+from src.ui import CLI, AsyncCLI, Dashboard
 
 def load_config(path: str = "config.json") -> dict:
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,14 +23,123 @@ def load_config(path: str = "config.json") -> dict:
         return {"memory": 1024, "max_processes": 10, "initial_speed_hz": 1.0}
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Эмулятор операционной системы (Лаб. 4)")
+    parser.add_argument("--config", default="config.json", help="Путь к файлу конфигурации.")
+    parser.add_argument("--ticks", type=int, help="Количество тактов для пакетного режима.")
+    parser.add_argument("--no-ui", action="store_true", help="Запуск без интерфейса и без задержек между тактами.")
+    parser.add_argument("--engine", choices=["tick", "event"], default="tick",
+                        help="Движок пакетного режима: потактовый или событийный (пропуск простоя).")
+    parser.add_argument("--dashboard", action="store_true",
+                        help="Живая панель с обновлением по таймеру вместо обновления по Enter.")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Симуляция и обработка команд - сопрограммы asyncio в одном потоке.")
+    parser.add_argument("--refresh", type=float, default=0.25, help="Период обновления панели, с.")
+    parser.add_argument("--seed", type=int, help="Зерно генератора случайных чисел симуляции.")
+    parser.add_argument("--record-workload", metavar="PATH", help="Сохранить сгенерированную нагрузку в файл трассы.")
+    parser.add_argument("--replay-workload", metavar="PATH", help="Воспроизвести нагрузку из файла трассы.")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Записывать переходы состояний процессов в двоичную трассу (анализ: python -m src.trace_analyzer).")
+    parser.add_argument("--load-checkpoint", metavar="PATH", help="Продолжить симуляцию из контрольной точки.")
+    parser.add_argument("--save-checkpoint", metavar="PATH", help="Сохранить контрольную точку после завершения.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Выполнить пакетный прогон под cProfile и записать отсортированную статистику.")
+    parser.add_argument("--profile-sort", default="cumulative", choices=["cumulative", "tottime", "ncalls"],
+                        help="Порядок сортировки статистики cProfile.")
+    parser.add_argument("--phase-timing", metavar="PATH",
+                        help="Замерять время фаз такта и записать отчёт в JSON.")
+    args = parser.parse_args()
+
+    if args.use_async and args.dashboard:
+        parser.error("--async работает только с построчным интерфейсом (без --dashboard)")
+    if args.profile and not args.no_ui:
+        parser.error("--profile работает только в пакетном режиме (--no-ui)")
+    if args.load_checkpoint and args.trace:
+        parser.error("--trace нельзя совместить с --load-checkpoint: трасса начинается с запуска системы")
+    if args.no_ui and args.ticks is None:
+        parser.error("--no-ui требует указать --ticks N")
+    if args.ticks is not None and not args.no_ui:
+        parser.error("--ticks работает только в пакетном режиме (--no-ui)")
+
+    return args
+
+
+def run_headless(os_emulator: OperatingSystem, ticks: int, event_driven: bool = False) -> None:
+    started = time.perf_counter()
+    stats = os_emulator.run_for(ticks, event_driven=event_driven)
+    elapsed = time.perf_counter() - started
+
+    print(f"Выполнено тактов: {stats['tick']} за {elapsed:.3f} с ({ticks / elapsed if elapsed > 0 else 0:.0f} такт/сек)")
+    for key, value in stats.items():
+        if key in ("all_processes", "next_task"):
+            continue
+        if isinstance(value, dict):
+            print(f"  {key}:")
+            for name, metric in value.items():
+                print(f"    {name}: {metric}")
+        else:
+            print(f"  {key}: {value}")
+
+
 def main():
+    args = parse_args()
     print("Инициализация эмулятора...")
 
-    config = load_config()
-    os_emulator = OperatingSystem(config)
-    cli = CLI(os_emulator)
-    print("Запуск интерфейса. Введите 'help' для списка команд.")
-    cli.start()
+    config = load_config(args.config)
+    if args.seed is not None:
+        config['seed'] = args.seed
+    if args.record_workload or args.replay_workload:
+        workload_config = dict(config.get('workload', {}))
+        workload_config['record'] = bool(args.record_workload)
+        if args.replay_workload:
+            workload_config['replay'] = args.replay_workload
+        config['workload'] = workload_config
+    if args.trace:
+        config['trace_path'] = args.trace
+
+    if args.load_checkpoint:
+        try:
+            os_emulator = OperatingSystem.load_checkpoint(args.load_checkpoint)
+        except (OSError, ValueError) as error:
+            print(f"Ошибка: {error}")
+            return
+        print(f"Загружена контрольная точка: такт {os_emulator.tick_count}")
+    else:
+        os_emulator = OperatingSystem(config)
+    if args.phase_timing:
+        os_emulator.enable_profiler()
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(run_headless, os_emulator, args.ticks, event_driven=args.engine == "event")
+        with open(args.profile, "w") as f:
+            pstats.Stats(profiler, stream=f).sort_stats(args.profile_sort).print_stats()
+        print(f"Профиль cProfile записан -> {args.profile}")
+    elif args.no_ui:
+        run_headless(os_emulator, args.ticks, event_driven=args.engine == "event")
+    else:
+        if args.use_async:
+            cli = AsyncCLI(AsyncRuntime(os_emulator))
+        elif args.dashboard:
+            cli = Dashboard(os_emulator, refresh_interval=args.refresh)
+        else:
+            cli = CLI(os_emulator)
+        print("Запуск интерфейса. Введите 'help' для списка команд.")
+        cli.start()
+
+    os_emulator.close()
+    if args.phase_timing:
+        os_emulator.profiler.dump(args.phase_timing)
+        print(f"Время фаз такта записано -> {args.phase_timing}")
+    if args.trace:
+        print(f"Трасса записана: {os_emulator.tracer.records} записей -> {args.trace}")
+    if args.save_checkpoint:
+        size = os_emulator.save_checkpoint(args.save_checkpoint)
+        print(f"Контрольная точка сохранена: такт {os_emulator.tick_count}, {size} байт -> {args.save_checkpoint}")
+    if args.record_workload:
+        saved = os_emulator.workload.save_trace(args.record_workload)
+        print(f"Нагрузка записана: {saved} задач -> {args.record_workload}")
+
     print("Эмулятор завершил свою работу.")
 
 if __name__ == "__main__":
@@ -4,11 +4,20 @@ class CommandType(Enum):
     COMPUTE = auto()  # Вычислительная операция
     IO = auto()       # Операция ввода-вывода
     EXIT = auto()     # Команда завершения процесса
+    PAGE_FAULT = auto()  # Сигнал страничного прерывания: страница команды не в памяти
 
 
 class Command:
+    __slots__ = ("type",)
+
     def __init__(self, type: CommandType):
         self.type = type
 
     def __repr__(self) -> str:
         return f"Command(type={self.type.name})"
+
+
+# Программа процесса хранится как bytes из кодов CommandType.value;
+# команды неизменяемы, поэтому на каждый код приходится один общий объект
+COMMANDS = {command_type.value: Command(command_type) for command_type in CommandType}
+EXIT_COMMAND = COMMANDS[CommandType.EXIT.value]
@@ -1,33 +1,67 @@
-
-import random
-from typing import Optional
+from typing import Optional, Tuple
 
 from .process import Process
-from .command import Command, CommandType
+from .command import COMMANDS, EXIT_COMMAND, Command, CommandType
+
+_IO_CODE = CommandType.IO.value
+_COMPUTE_COMMAND = COMMANDS[CommandType.COMPUTE.value]
+_PAGE_FAULT_COMMAND = COMMANDS[CommandType.PAGE_FAULT.value]
 
 
 class CPU:
-    def __init__(self, io_command_probability: float):
+    def __init__(self, mmu=None):
         self.current_process: Optional[Process] = None
-        self.io_command_probability = io_command_probability
         self.last_executed_command: Optional[Command] = None
+        # Диспетчер страничной памяти (PagingMemoryManager) или None
+        self.mmu = mmu
 
     def _fetch_command(self, process: Process) -> Command:
         if process.program_counter >= process.program_length:
-            return Command(type=CommandType.EXIT)
-
-        if random.random() < self.io_command_probability:
-            return Command(type=CommandType.IO)
+            return EXIT_COMMAND
 
-        return Command(type=CommandType.COMPUTE)
+        return COMMANDS[process.program[process.program_counter]]
 
     def _do_operation(self, command: Command) -> CommandType:
         return command.type
 
     def execute(self, process: Process) -> CommandType:
         self.current_process = process
+        mmu = self.mmu
+        if mmu is not None and process.pages is not None and process.program_counter < process.program_length:
+            if not mmu.access(process.pid, process.pages[process.program_counter]):
+                # Команда не выполняется: счётчик команд остаётся на месте до загрузки страницы
+                self.last_executed_command = _PAGE_FAULT_COMMAND
+                return CommandType.PAGE_FAULT
+
         command = self._fetch_command(process)
         self.last_executed_command = command
         process.program_counter += 1
         result_signal = self._do_operation(command)
         return result_signal
+
+    def execute_burst(self, process: Process, max_ticks: int) -> Tuple[int, CommandType]:
+        # Выполняет до max_ticks команд подряд, останавливаясь на первой не-вычислительной.
+        # Эквивалентно последовательным вызовам execute, но без цикла по тактам.
+        # Обращения к страницам здесь не проверяются - при страничной памяти используется execute.
+        self.current_process = process
+        pc = process.program_counter
+        length = process.program_length
+
+        if pc >= length:
+            signal_index = pc
+        else:
+            signal_index = process.program.find(_IO_CODE, pc, length)
+            if signal_index < 0:
+                signal_index = length
+
+        if signal_index - pc + 1 <= max_ticks:
+            executed = signal_index - pc + 1
+            command = EXIT_COMMAND if signal_index >= length else COMMANDS[process.program[signal_index]]
+        else:
+            executed = max_ticks
+            command = _COMPUTE_COMMAND
+
+        process.program_counter = pc + executed
+        self.last_executed_command = command
+        return executed, command.type
+
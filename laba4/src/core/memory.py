@@ -1,19 +1,40 @@
-from typing import Dict
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from .paging import REPLACEMENT_POLICIES, TLB
 
 class MemoryManager:
+    name = "counter"
+
     def __init__(self, total_size: int):
         self.total_size: int = total_size
         self.used_memory: int = 0
         self.allocated_blocks: Dict[int, int] = {}
+        self.allocation_attempts: int = 0
+        self.allocation_failures: int = 0
 
     def has_enough_space(self, size: int) -> bool:
         return self.total_size - self.used_memory >= size
 
+    @property
+    def free_space(self) -> int:
+        return self.total_size - self.used_memory
+
+    def reclaimable(self, pid: int) -> int:
+        # Не меньше, чем вернёт free(pid) - для быстрой отсечки до точной проверки fits_after_free
+        return self.allocated_blocks[pid]
+
+    def fits_after_free(self, pids: List[int], size: int) -> bool:
+        # Поместится ли запрос, если освободить pids; состояние распределителя не меняется
+        return self.free_space + sum(self.allocated_blocks[pid] for pid in pids) >= size
+
     def allocate(self, pid: int, size: int) -> bool:
         if pid in self.allocated_blocks:
             return False
 
+        self.allocation_attempts += 1
         if not self.has_enough_space(size):
+            self.allocation_failures += 1
             return False
 
         self.used_memory += size
@@ -28,5 +49,557 @@ class MemoryManager:
         self.used_memory -= size_to_free
         return True
 
+    def stats(self) -> Dict:
+        return {
+            "allocator": self.name,
+            "used": self.used_memory,
+            "total": self.total_size,
+            "allocation_attempts": self.allocation_attempts,
+            "allocation_failures": self.allocation_failures,
+            "failure_rate": round(self.allocation_failures / self.allocation_attempts, 4)
+            if self.allocation_attempts else 0.0,
+        }
+
     def __repr__(self) -> str:
         return f"MemoryManager(used={self.used_memory}/{self.total_size})"
+
+
+class ExtentMemoryManager(MemoryManager):
+    # Непрерывное адресное пространство: свободные участки хранятся дважды -
+    # по адресу (для слияния соседей) и по размеру (для best/worst fit за O(log n))
+    STRATEGIES = ("first_fit", "best_fit", "next_fit", "worst_fit")
+
+    def __init__(self, total_size: int, strategy: str = "first_fit"):
+        super().__init__(total_size)
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Неизвестная стратегия размещения: {strategy}")
+
+        self.name = strategy
+        self.strategy: str = strategy
+        self.free_starts: List[int] = []
+        self.free_extents: Dict[int, int] = {}
+        self.free_by_size: List[Tuple[int, int]] = []
+        self.allocated_extents: Dict[int, Tuple[int, int]] = {}
+        self._next_fit_position: int = 0
+
+        if total_size > 0:
+            self._insert_extent(0, total_size)
+
+    def _insert_extent(self, start: int, size: int) -> None:
+        insort(self.free_starts, start)
+        self.free_extents[start] = size
+        insort(self.free_by_size, (size, start))
+
+    def _remove_extent(self, start: int) -> int:
+        size = self.free_extents.pop(start)
+        del self.free_starts[bisect_left(self.free_starts, start)]
+        del self.free_by_size[bisect_left(self.free_by_size, (size, start))]
+        return size
+
+    @property
+    def largest_free_block(self) -> int:
+        return self.free_by_size[-1][0] if self.free_by_size else 0
+
+    def has_enough_space(self, size: int) -> bool:
+        return self.largest_free_block >= size
+
+    def fits_after_free(self, pids: List[int], size: int) -> bool:
+        if self.largest_free_block >= size:
+            return True
+
+        # Освобождённые участки сливаются с прилегающими свободными и друг с другом;
+        # остальные свободные участки меньше запроса
+        merged_start, merged_end = -1, -1
+        for start, length in sorted(self.allocated_extents[pid] for pid in pids):
+            end = start + length
+            index = bisect_left(self.free_starts, start)
+            if index > 0:
+                previous = self.free_starts[index - 1]
+                if previous + self.free_extents[previous] == start:
+                    start = previous
+            end += self.free_extents.get(end, 0)
+
+            if start <= merged_end:
+                merged_end = max(merged_end, end)
+            else:
+                merged_start, merged_end = start, end
+            if merged_end - merged_start >= size:
+                return True
+        return False
+
+    def _find_extent(self, size: int) -> Optional[int]:
+        if self.strategy == "best_fit":
+            index = bisect_left(self.free_by_size, (size, -1))
+            return self.free_by_size[index][1] if index < len(self.free_by_size) else None
+
+        if self.strategy == "worst_fit":
+            return self.free_by_size[-1][1] if self.largest_free_block >= size else None
+
+        starts = self.free_starts
+        first = bisect_left(starts, self._next_fit_position) if self.strategy == "next_fit" else 0
+        for i in range(len(starts)):
+            start = starts[(first + i) % len(starts)]
+            if self.free_extents[start] >= size:
+                return start
+        return None
+
+    def allocate(self, pid: int, size: int) -> bool:
+        if pid in self.allocated_blocks:
+            return False
+
+        self.allocation_attempts += 1
+        start = self._find_extent(size) if size <= self.largest_free_block else None
+        if start is None:
+            self.allocation_failures += 1
+            return False
+
+        extent_size = self._remove_extent(start)
+        if extent_size > size:
+            self._insert_extent(start + size, extent_size - size)
+
+        self._next_fit_position = start + size
+        self.used_memory += size
+        self.allocated_blocks[pid] = size
+        self.allocated_extents[pid] = (start, size)
+        return True
+
+    def free(self, pid: int) -> bool:
+        if pid not in self.allocated_extents:
+            return False
+
+        start, size = self.allocated_extents.pop(pid)
+        del self.allocated_blocks[pid]
+        self.used_memory -= size
+
+        # Слияние с соседними свободными участками
+        index = bisect_left(self.free_starts, start)
+        if index < len(self.free_starts) and self.free_starts[index] == start + size:
+            size += self._remove_extent(start + size)
+        if index > 0:
+            previous = self.free_starts[index - 1]
+            if previous + self.free_extents[previous] == start:
+                size += self._remove_extent(previous)
+                start = previous
+
+        self._insert_extent(start, size)
+        return True
+
+    @property
+    def external_fragmentation(self) -> float:
+        free_memory = self.total_size - self.used_memory
+        return round(1 - self.largest_free_block / free_memory, 4) if free_memory else 0.0
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats.update({
+            "free_extents": len(self.free_starts),
+            "largest_free_block": self.largest_free_block,
+            "external_fragmentation": self.external_fragmentation,
+        })
+        return stats
+
+    def __repr__(self) -> str:
+        return f"ExtentMemoryManager({self.strategy}, used={self.used_memory}/{self.total_size}, extents={len(self.free_starts)})"
+
+
+class BuddyMemoryManager(MemoryManager):
+    # Двоичный "близнецовый" распределитель: блоки размера min_block * 2^order,
+    # списки свободных блоков по порядкам, слияние с близнецом при освобождении
+    name = "buddy"
+
+    def __init__(self, total_size: int, min_block: int = 16):
+        super().__init__(total_size)
+        self.min_block: int = min_block
+        self.max_order: int = max(0, (total_size // min_block).bit_length() - 1)
+        self.free_lists: List[set] = [set() for _ in range(self.max_order + 1)]
+        self.allocated_orders: Dict[int, Tuple[int, int]] = {}
+        self.requested_memory: int = 0
+
+        # Память, не кратная степени двойки, покрывается несколькими выровненными блоками
+        start = 0
+        for order in range(self.max_order, -1, -1):
+            block_size = min_block << order
+            if start + block_size <= total_size:
+                self.free_lists[order].add(start)
+                start += block_size
+
+    def _order_for(self, size: int) -> int:
+        blocks = max(1, -(-size // self.min_block))
+        return (blocks - 1).bit_length()
+
+    def has_enough_space(self, size: int) -> bool:
+        order = self._order_for(size)
+        return any(self.free_lists[o] for o in range(order, self.max_order + 1))
+
+    def reclaimable(self, pid: int) -> int:
+        return self.min_block << self.allocated_orders[pid][1]
+
+    def fits_after_free(self, pids: List[int], size: int) -> bool:
+        if self.has_enough_space(size):
+            return True
+
+        # Слияние с близнецами повторяется поверх списков свободных блоков без их изменения:
+        # added - новые свободные блоки, merged - существующие, поглощённые слиянием
+        needed = self._order_for(size)
+        added = set()
+        merged = set()
+        for pid in pids:
+            start, order = self.allocated_orders[pid]
+            while order < self.max_order:
+                buddy = start ^ (self.min_block << order)
+                if (buddy, order) in added:
+                    added.remove((buddy, order))
+                elif buddy in self.free_lists[order] and (buddy, order) not in merged:
+                    merged.add((buddy, order))
+                else:
+                    break
+                start = min(start, buddy)
+                order += 1
+            if order >= needed:
+                return True
+            added.add((start, order))
+        return False
+
+    def allocate(self, pid: int, size: int) -> bool:
+        if pid in self.allocated_blocks:
+            return False
+
+        self.allocation_attempts += 1
+        order = self._order_for(size)
+        current = order
+        while current <= self.max_order and not self.free_lists[current]:
+            current += 1
+        if current > self.max_order:
+            self.allocation_failures += 1
+            return False
+
+        start = self.free_lists[current].pop()
+        while current > order:
+            current -= 1
+            self.free_lists[current].add(start + (self.min_block << current))
+
+        self.used_memory += self.min_block << order
+        self.requested_memory += size
+        self.allocated_blocks[pid] = size
+        self.allocated_orders[pid] = (start, order)
+        return True
+
+    def free(self, pid: int) -> bool:
+        if pid not in self.allocated_orders:
+            return False
+
+        start, order = self.allocated_orders.pop(pid)
+        self.requested_memory -= self.allocated_blocks.pop(pid)
+        self.used_memory -= self.min_block << order
+
+        while order < self.max_order:
+            buddy = start ^ (self.min_block << order)
+            if buddy not in self.free_lists[order]:
+                break
+            self.free_lists[order].remove(buddy)
+            start = min(start, buddy)
+            order += 1
+        self.free_lists[order].add(start)
+        return True
+
+    @property
+    def internal_fragmentation(self) -> float:
+        return round(1 - self.requested_memory / self.used_memory, 4) if self.used_memory else 0.0
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats.update({
+            "requested": self.requested_memory,
+            "internal_fragmentation": self.internal_fragmentation,
+            "free_blocks_by_order": {self.min_block << order: len(blocks)
+                                     for order, blocks in enumerate(self.free_lists) if blocks},
+        })
+        return stats
+
+
+class _Slab:
+    __slots__ = ("key", "object_size", "free_slots", "capacity")
+
+    def __init__(self, key: int, object_size: int, capacity: int):
+        self.key: int = key
+        self.object_size: int = object_size
+        self.free_slots: List[int] = list(range(capacity - 1, -1, -1))
+        self.capacity: int = capacity
+
+
+class SlabMemoryManager(MemoryManager):
+    # Классы размеров для частых запросов (в основном default_process_size):
+    # объекты одного класса лежат в слябах, слябы и крупные запросы берутся
+    # из общего непрерывного пространства
+    name = "slab"
+
+    def __init__(self, total_size: int, size_classes: List[int], objects_per_slab: int = 8):
+        super().__init__(total_size)
+        self.size_classes: List[int] = sorted(size_classes)
+        self.objects_per_slab: int = objects_per_slab
+        self.backing = ExtentMemoryManager(total_size, strategy="first_fit")
+        self.partial_slabs: Dict[int, Dict[int, _Slab]] = {size: {} for size in self.size_classes}
+        self.allocations: Dict[int, Tuple[Optional[_Slab], int]] = {}
+        self.requested_memory: int = 0
+        self.object_memory: int = 0
+        self.slab_count: int = 0
+        self._next_slab_key: int = -1
+
+    def _size_class(self, size: int) -> Optional[int]:
+        index = bisect_left(self.size_classes, size)
+        return self.size_classes[index] if index < len(self.size_classes) else None
+
+    def has_enough_space(self, size: int) -> bool:
+        size_class = self._size_class(size)
+        if size_class is None:
+            return self.backing.has_enough_space(size)
+        return bool(self.partial_slabs[size_class]) or self.backing.has_enough_space(size_class * self.objects_per_slab)
+
+    def reclaimable(self, pid: int) -> int:
+        slab, _ = self.allocations[pid]
+        return self.allocated_blocks[pid] if slab is None else slab.object_size * slab.capacity
+
+    def fits_after_free(self, pids: List[int], size: int) -> bool:
+        if self.has_enough_space(size):
+            return True
+
+        # Слот своего класса подходит сразу; в общее пространство возвращаются крупные блоки
+        # и слябы, освободившиеся целиком
+        size_class = self._size_class(size)
+        released: List[int] = []
+        freed_slots: Dict[int, int] = {}
+        for pid in pids:
+            slab, _ = self.allocations[pid]
+            if slab is None:
+                released.append(pid)
+                continue
+            if slab.object_size == size_class:
+                return True
+            freed_slots[slab.key] = freed_slots.get(slab.key, 0) + 1
+            if len(slab.free_slots) + freed_slots[slab.key] == slab.capacity:
+                released.append(slab.key)
+
+        needed = size if size_class is None else size_class * self.objects_per_slab
+        return self.backing.fits_after_free(released, needed)
+
+    def _new_slab(self, size_class: int) -> Optional[_Slab]:
+        key = self._next_slab_key
+        if not self.backing.allocate(key, size_class * self.objects_per_slab):
+            return None
+
+        self._next_slab_key -= 1
+        self.slab_count += 1
+        slab = _Slab(key, size_class, self.objects_per_slab)
+        self.partial_slabs[size_class][key] = slab
+        return slab
+
+    def allocate(self, pid: int, size: int) -> bool:
+        if pid in self.allocated_blocks:
+            return False
+
+        self.allocation_attempts += 1
+        size_class = self._size_class(size)
+
+        if size_class is None:
+            if not self.backing.allocate(pid, size):
+                self.allocation_failures += 1
+                return False
+            self.allocations[pid] = (None, 0)
+            self.object_memory += size
+        else:
+            partial = self.partial_slabs[size_class]
+            slab = next(iter(partial.values())) if partial else self._new_slab(size_class)
+            if slab is None:
+                self.allocation_failures += 1
+                return False
+
+            slot = slab.free_slots.pop()
+            if not slab.free_slots:
+                del partial[slab.key]
+            self.allocations[pid] = (slab, slot)
+            self.object_memory += size_class
+
+        self.requested_memory += size
+        self.allocated_blocks[pid] = size
+        self.used_memory = self.backing.used_memory
+        return True
+
+    def free(self, pid: int) -> bool:
+        if pid not in self.allocations:
+            return False
+
+        slab, slot = self.allocations.pop(pid)
+        size = self.allocated_blocks.pop(pid)
+        self.requested_memory -= size
+
+        if slab is None:
+            self.backing.free(pid)
+            self.object_memory -= size
+        else:
+            self.object_memory -= slab.object_size
+            partial = self.partial_slabs[slab.object_size]
+            slab.free_slots.append(slot)
+            if len(slab.free_slots) == slab.capacity:
+                # Пустой сляб возвращается в общее пространство
+                partial.pop(slab.key, None)
+                self.backing.free(slab.key)
+                self.slab_count -= 1
+            else:
+                partial[slab.key] = slab
+
+        self.used_memory = self.backing.used_memory
+        return True
+
+    @property
+    def internal_fragmentation(self) -> float:
+        return round(1 - self.requested_memory / self.used_memory, 4) if self.used_memory else 0.0
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats.update({
+            "requested": self.requested_memory,
+            "internal_fragmentation": self.internal_fragmentation,
+            "slabs": self.slab_count,
+            "slab_free_bytes": self.used_memory - self.object_memory,
+            "largest_free_block": self.backing.largest_free_block,
+            "external_fragmentation": self.backing.external_fragmentation,
+        })
+        return stats
+
+
+class PagingMemoryManager(MemoryManager):
+    # Виртуальная память со страничной организацией: при допуске создаётся только
+    # таблица страниц, кадры выделяются по требованию при страничном прерывании.
+    # used_memory - занятые кадры физической памяти.
+    name = "paging"
+
+    def __init__(self, total_size: int, page_size: int = 64, replacement: str = "lru", tlb_entries: int = 16,
+                 fault_latency: int = 10, virtual_size: Optional[int] = None):
+        super().__init__(total_size)
+        if page_size <= 0 or total_size < page_size:
+            raise ValueError(f"Некорректный размер страницы: {page_size}")
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Неизвестная политика замещения страниц: {replacement}")
+
+        self.page_size: int = page_size
+        self.frame_count: int = total_size // page_size
+        self.fault_latency: int = fault_latency
+        self.virtual_size: int = virtual_size if virtual_size is not None else total_size * 4
+        self.virtual_used: int = 0
+
+        self.free_frames: List[int] = list(range(self.frame_count - 1, -1, -1))
+        self.frame_owner: List[Optional[Tuple[int, int]]] = [None] * self.frame_count
+        # Таблица страниц процесса: номер страницы -> номер кадра (-1 - страница не в памяти)
+        self.page_tables: Dict[int, List[int]] = {}
+        self.replacement = REPLACEMENT_POLICIES[replacement](self.frame_count)
+        self.tlb = TLB(tlb_entries)
+
+        self.accesses: int = 0
+        self.page_faults: int = 0
+        self.evictions: int = 0
+
+    def page_count(self, size: int) -> int:
+        return max(1, -(-size // self.page_size))
+
+    def has_enough_space(self, size: int) -> bool:
+        return self.virtual_used + size <= self.virtual_size
+
+    @property
+    def free_space(self) -> int:
+        return self.virtual_size - self.virtual_used
+
+    def allocate(self, pid: int, size: int) -> bool:
+        if pid in self.page_tables:
+            return False
+
+        self.allocation_attempts += 1
+        if not self.has_enough_space(size):
+            self.allocation_failures += 1
+            return False
+
+        self.page_tables[pid] = [-1] * self.page_count(size)
+        self.allocated_blocks[pid] = size
+        self.virtual_used += size
+        return True
+
+    def free(self, pid: int) -> bool:
+        if pid not in self.page_tables:
+            return False
+
+        for page, frame in enumerate(self.page_tables.pop(pid)):
+            if frame >= 0:
+                self.replacement.remove(frame)
+                self.tlb.invalidate(pid, page)
+                self.frame_owner[frame] = None
+                self.free_frames.append(frame)
+                self.used_memory -= self.page_size
+        self.virtual_used -= self.allocated_blocks.pop(pid)
+        return True
+
+    def access(self, pid: int, page: int) -> bool:
+        self.accesses += 1
+        frame = self.tlb.lookup(pid, page)
+        if frame is None:
+            frame = self.page_tables[pid][page]
+            if frame < 0:
+                return False
+            self.tlb.insert(pid, page, frame)
+
+        self.replacement.touch(frame)
+        return True
+
+    def handle_page_fault(self, pid: int, page: int) -> None:
+        self.page_faults += 1
+        if self.free_frames:
+            frame = self.free_frames.pop()
+        else:
+            frame = self.replacement.victim()
+            owner_pid, owner_page = self.frame_owner[frame]
+            self.page_tables[owner_pid][owner_page] = -1
+            self.tlb.invalidate(owner_pid, owner_page)
+            self.evictions += 1
+            self.used_memory -= self.page_size
+
+        self.frame_owner[frame] = (pid, page)
+        self.page_tables[pid][page] = frame
+        self.replacement.insert(frame)
+        self.used_memory += self.page_size
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats.update({
+            "replacement": self.replacement.name,
+            "page_size": self.page_size,
+            "frames": f"{self.frame_count - len(self.free_frames)}/{self.frame_count}",
+            "virtual": f"{self.virtual_used}/{self.virtual_size}",
+            "accesses": self.accesses,
+            "page_faults": self.page_faults,
+            "fault_rate": round(self.page_faults / self.accesses, 4) if self.accesses else 0.0,
+            "evictions": self.evictions,
+            "tlb_hit_rate": self.tlb.hit_rate,
+        })
+        return stats
+
+
+def create_memory_manager(config: Dict) -> MemoryManager:
+    allocator = config.get('memory_allocator', MemoryManager.name)
+    total_size = config['memory']
+
+    if allocator == MemoryManager.name:
+        return MemoryManager(total_size=total_size)
+    if allocator in ExtentMemoryManager.STRATEGIES:
+        return ExtentMemoryManager(total_size=total_size, strategy=allocator)
+    if allocator == BuddyMemoryManager.name:
+        return BuddyMemoryManager(total_size=total_size, min_block=config.get('buddy_min_block', 16))
+    if allocator == SlabMemoryManager.name:
+        default_size = config.get('default_process_size', 128)
+        size_classes = config.get('slab_size_classes', [default_size // 4, default_size // 2, default_size])
+        return SlabMemoryManager(total_size=total_size, size_classes=[size for size in size_classes if size > 0],
+                                 objects_per_slab=config.get('slab_objects', 8))
+    if allocator == PagingMemoryManager.name:
+        return PagingMemoryManager(total_size=total_size, page_size=config.get('page_size', 64),
+                                   replacement=config.get('page_replacement', 'lru'),
+                                   tlb_entries=config.get('tlb_entries', 16),
+                                   fault_latency=config.get('page_fault_latency', 10),
+                                   virtual_size=config.get('virtual_memory'))
+    raise ValueError(f"Неизвестный распределитель памяти: {allocator}")
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class FIFOReplacement:
+    name = "fifo"
+
+    def __init__(self, frame_count: int):
+        self.frames: OrderedDict[int, None] = OrderedDict()
+
+    def insert(self, frame: int) -> None:
+        self.frames[frame] = None
+
+    def touch(self, frame: int) -> None:
+        pass
+
+    def remove(self, frame: int) -> None:
+        self.frames.pop(frame, None)
+
+    def victim(self) -> int:
+        frame, _ = self.frames.popitem(last=False)
+        return frame
+
+
+class LRUReplacement(FIFOReplacement):
+    # Порядок OrderedDict - порядок последних обращений, вытесняется самый старый
+    name = "lru"
+
+    def touch(self, frame: int) -> None:
+        self.frames.move_to_end(frame)
+
+
+class ClockReplacement:
+    # Алгоритм "второго шанса": бит обращения сбрасывается при проходе стрелки
+    name = "clock"
+
+    def __init__(self, frame_count: int):
+        self.present = bytearray(frame_count)
+        self.referenced = bytearray(frame_count)
+        self.hand: int = 0
+
+    def insert(self, frame: int) -> None:
+        self.present[frame] = 1
+        self.referenced[frame] = 1
+
+    def touch(self, frame: int) -> None:
+        self.referenced[frame] = 1
+
+    def remove(self, frame: int) -> None:
+        self.present[frame] = 0
+        self.referenced[frame] = 0
+
+    def victim(self) -> int:
+        present, referenced = self.present, self.referenced
+        frame_count = len(present)
+        while True:
+            frame = self.hand
+            self.hand = (frame + 1) % frame_count
+            if not present[frame]:
+                continue
+            if referenced[frame]:
+                referenced[frame] = 0
+                continue
+            present[frame] = 0
+            return frame
+
+
+class LFUReplacement:
+    # LFU с динамическим старением: новая страница получает счётчик вытесненной,
+    # иначе только что загруженные страницы сразу становятся жертвами.
+    # Корзины по счётчику: внутри корзины вытесняется самый давно попавший в неё кадр.
+    name = "lfu"
+
+    def __init__(self, frame_count: int):
+        self.counts: Dict[int, int] = {}
+        self.buckets: Dict[int, OrderedDict[int, None]] = {}
+        self.min_count: int = 0
+        self.age: int = 0
+
+    def _link(self, frame: int, count: int) -> None:
+        self.counts[frame] = count
+        self.buckets.setdefault(count, OrderedDict())[frame] = None
+
+    def _unlink(self, frame: int, count: int) -> None:
+        bucket = self.buckets[count]
+        del bucket[frame]
+        if not bucket:
+            del self.buckets[count]
+
+    def insert(self, frame: int) -> None:
+        count = self.age + 1
+        if count < self.min_count or self.min_count not in self.buckets:
+            self.min_count = count
+        self._link(frame, count)
+
+    def touch(self, frame: int) -> None:
+        count = self.counts[frame]
+        self._unlink(frame, count)
+        if self.min_count == count and count not in self.buckets:
+            self.min_count = count + 1
+        self._link(frame, count + 1)
+
+    def remove(self, frame: int) -> None:
+        count = self.counts.pop(frame, None)
+        if count is not None:
+            self._unlink(frame, count)
+
+    def victim(self) -> int:
+        if self.min_count not in self.buckets:
+            self.min_count = min(self.buckets)
+        count = self.min_count
+        bucket = self.buckets[count]
+        frame, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.buckets[count]
+        del self.counts[frame]
+        self.age = count
+        return frame
+
+
+REPLACEMENT_POLICIES = {
+    policy.name: policy for policy in (FIFOReplacement, LRUReplacement, ClockReplacement, LFUReplacement)
+}
+
+
+class TLB:
+    # Полностью ассоциативный буфер трансляции с вытеснением LRU
+    def __init__(self, entries: int):
+        self.entries: int = entries
+        self.cache: OrderedDict[Tuple[int, int], int] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def lookup(self, pid: int, page: int) -> Optional[int]:
+        key = (pid, page)
+        frame = self.cache.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.cache.move_to_end(key)
+        return frame
+
+    def insert(self, pid: int, page: int, frame: int) -> None:
+        if self.entries <= 0:
+            return
+
+        self.cache[(pid, page)] = frame
+        if len(self.cache) > self.entries:
+            self.cache.popitem(last=False)
+
+    def invalidate(self, pid: int, page: int) -> None:
+        self.cache.pop((pid, page), None)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return round(self.hits / lookups, 4) if lookups else 0.0
@@ -1,5 +1,9 @@
+from array import array
 from enum import Enum
 from itertools import count
+from typing import FrozenSet, Optional
+
+from .command import CommandType
 
 class ProcessState(Enum):
     NEW = "NEW"
@@ -16,15 +20,52 @@ class ProcessState(Enum):
     TERMINATED = "Завершен"
 
 class Process:
+    # Без __dict__: при сотнях тысяч процессов экономит память и ускоряет доступ к полям
+    __slots__ = (
+        "pid", "size", "program_counter", "state", "ticks_worked_in_quantum", "program_length", "program",
+        "pages", "devices", "io_device", "io_time_remaining", "io_duration",
+        "priority", "queue_level", "vruntime", "affinity", "last_core",
+        "arrival_tick", "first_run_tick", "completion_tick", "cpu_ticks", "io_wait_ticks", "memory_wait_ticks",
+        "ready_wait_ticks", "state_since",
+    )
     _id_counter = count(0)
-    def __init__(self, size: int, program_length: int):
+
+    def __init__(self, size: int, program_length: int, priority: int = 0, io_duration: Optional[int] = None,
+                 program: Optional[bytes] = None, pages: Optional[array] = None, devices: Optional[bytes] = None):
         self.pid: int = next(self._id_counter)
         self.size: int = size
         self.program_counter: int = 0
         self.state: ProcessState = ProcessState.NEW
         self.ticks_worked_in_quantum: int = 0
         self.program_length: int = program_length
+        # Коды CommandType.value, сгенерированные один раз при создании процесса
+        self.program: bytes = program if program is not None else bytes((CommandType.COMPUTE.value,)) * program_length
+        # Номер виртуальной страницы, к которой обращается каждая команда (при страничной памяти)
+        self.pages: Optional[array] = pages
+        # Номер устройства для каждой команды ввода-вывода и устройство текущего запроса (-1 - нет)
+        self.devices: Optional[bytes] = devices
+        self.io_device: int = -1
         self.io_time_remaining: int = 0
+        self.io_duration: Optional[int] = io_duration
+
+        # Поля политик планирования
+        self.priority: int = priority
+        self.queue_level: int = 0
+        self.vruntime: float = 0.0
+
+        # Ядра, на которых разрешено выполнение (None - любые), и ядро последнего запуска
+        self.affinity: Optional[FrozenSet[int]] = None
+        self.last_core: int = -1
+
+        # Статистика, которую ведёт MetricsCollector (в тактах)
+        self.arrival_tick: int = -1
+        self.first_run_tick: int = -1
+        self.completion_tick: int = -1
+        self.cpu_ticks: int = 0
+        self.io_wait_ticks: int = 0
+        self.memory_wait_ticks: int = 0
+        self.ready_wait_ticks: int = 0
+        self.state_since: int = 0
 
     def __repr__(self) -> str:
         return f"Process(pid={self.pid}, state={self.state.value}, pc={self.program_counter}, size={self.size})"
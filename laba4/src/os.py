@@ -1,73 +1,230 @@
+import heapq
+import pickle
+import random
+import struct
+import threading
 import time
-from typing import Dict, Optional
+import zlib
+from collections import deque
+from array import array
+from itertools import count
+from typing import Dict, List, Optional, Tuple
 
 from .core.cpu import CPU
-from .core.memory import MemoryManager
+from .core.memory import PagingMemoryManager, create_memory_manager
 from .core.process import Process
 from .services.process_manager import ProcessManager
-from .services.scheduler import Scheduler
+from .services.scheduler import create_scheduler
+from .services.load_balancer import Core, LoadBalancer
+from .services.io_devices import IODevice, create_io_devices, device_weights
+from .services.snapshot import SnapshotPublisher, SystemSnapshot
+from .services.tracing import TraceEvent, TraceWriter
+from .services.profiler import TickProfiler
+from .services.pacing import Pacer
+from .services.metrics import MetricsCollector
+from .services.workload import Job, ReplayWorkload, Workload
 from .core.process import ProcessState
 from .core.command import Command, CommandType
 
+CHECKPOINT_MAGIC = b"OSCP"
+CHECKPOINT_VERSION = 2
+_CHECKPOINT_HEADER = struct.Struct("<4sH")
+
+
 class OperatingSystem:
     def __init__(self, config: Dict):
-        self.cpu = CPU(io_command_probability=config['io_command_probability'])
-        self.memory_manager = MemoryManager(total_size=config['memory'])
+        self.memory_manager = create_memory_manager(config)
         self.process_manager = ProcessManager(max_processes=config['max_processes'])
-        self.scheduler = Scheduler()
+        self.cpu_count: int = config.get('cpu_count', 1)
+        if self.cpu_count < 1:
+            raise ValueError(f"Некорректное число ядер: {self.cpu_count}")
+        self.metrics = MetricsCollector(cpu_count=self.cpu_count)
         self.default_process_size: int = config.get('default_process_size', 128)
         self.next_task_to_load: Optional[Process] = None
         self.speed_hz: float = config.get('initial_speed_hz', 1.0)
+        self.max_speed_hz: float = config.get('max_speed_hz', 1000.0)
+        # Темп реального времени: разрешение sleep (мс) и наибольшая пачка тактов за пробуждение
+        self.pacing_resolution: float = config.get('pacing_resolution_ms', 1.0) / 1000
+        self.pacing_max_batch: int = config.get('pacing_max_batch', 64)
+        self.pacer: Optional[Pacer] = None
         self._running: bool = False
         self.quantum_length: int = config.get('quantum_length', 5)
-        self.active_process: Optional[Process] = None
 
         self.program_length: int = config.get('program_length', 30)
-        self.io_command_probability: float = config.get('io_command_probability', 0.2)
         self.io_duration: int = config.get('io_duration', 15)
-        self.cpu = CPU(io_command_probability=self.io_command_probability)
-        self.blocked_queue: list[Process] = []
+
+        workload_config = config.get('workload', {})
+        if workload_config.get('replay'):
+            self.workload = ReplayWorkload(workload_config['replay'], config, record=workload_config.get('record', False))
+            self.seed: int = self.workload.seed
+        else:
+            seed = config.get('seed')
+            self.seed = seed if seed is not None else random.randrange(2 ** 32)
+            self.workload = Workload(config, self.seed, record=workload_config.get('record', False))
+        self.io_devices: List[IODevice] = create_io_devices(config, self.seed)
+        self._device_weights: List[float] = device_weights(config)
+        self.pending_tasks: deque[Process] = deque()
+        self._admission_blocked: bool = False
+
+        # Среднесрочный планировщик: образы выгруженных процессов в области подкачки
+        self.swap_size: int = config.get('swap_size', 0)
+        self.swap_latency: int = config.get('swap_latency', 20)
+        self.swap_used: int = 0
+        self.swapped: Dict[int, Process] = {}
+        self.swap_in_queue: deque[Process] = deque()
+        self._swap_in_blocked: bool = False
+        self._swap_free_tick: int = 0
+        # Кандидаты на выгрузку - процессы, ждущие ввода-вывода дольше обмена: куча по убыванию
+        # такта пробуждения с ленивым удалением. Запись действительна, пока её номер совпадает
+        # с _swap_candidate_ids[pid] = (номер, освобождаемая память)
+        self._swap_candidates: list[tuple[int, int, Process]] = []
+        self._swap_candidate_ids: Dict[int, Tuple[int, int]] = {}
+        self._swappable: int = 0
+        # Начатые выгрузки (такт окончания обмена, процесс, память): до конца обмена память занята
+        self._swap_outs: deque[Tuple[int, Process, int]] = deque()
+        self._swapping_out: int = 0
+
+        self.paging: bool = isinstance(self.memory_manager, PagingMemoryManager)
+        mmu = self.memory_manager if self.paging else None
+        self.cores: List[Core] = [Core(index, CPU(mmu=mmu), create_scheduler(config)) for index in range(self.cpu_count)]
+        self.load_balancer = LoadBalancer(self.cores, work_stealing=config.get('work_stealing', True))
+        self.blocked_queue: list[tuple[int, int, Process]] = []
+        self._blocked_sequence: int = 0
+        self.tick_count: int = 0
+        self._booted: bool = False
+
+        # Двоичная трасса переходов состояний; без trace_path не создаётся.
+        # Такт записи - первый такт, в котором процесс находится в новом состоянии
+        trace_path = config.get('trace_path')
+        self.tracer: Optional[TraceWriter] = TraceWriter(
+            trace_path, cpu_count=self.cpu_count, capacity=config.get('trace_buffer_records', 65536)
+        ) if trace_path else None
+
+        # Замер времени по фазам такта; выключенный профилировщик не добавляет в такт ни одной проверки
+        self.profiler: Optional[TickProfiler] = None
+        if config.get('profile_phases'):
+            self.enable_profiler()
+
+        # Такты и управляющие команды интерфейса (create, change_speed) не перемешиваются:
+        # поток симуляции держит блокировку на время пачки тактов
+        self._lock = threading.Lock()
+        self.snapshots = SnapshotPublisher(interval=config.get('snapshot_interval', 1),
+                                           period=config.get('snapshot_period', 0.1))
+        self.publish_snapshot()
+
+    # Первое ядро - для кода, рассчитанного на однопроцессорную систему
+    @property
+    def cpu(self) -> CPU:
+        return self.cores[0].cpu
+
+    @property
+    def scheduler(self):
+        return self.cores[0].scheduler
+
+    @property
+    def active_process(self) -> Optional[Process]:
+        return self.cores[0].active_process
+
+    def _enqueue(self, process: Process) -> None:
+        self.load_balancer.select_core(process).scheduler.add_process(process)
+
+    def _admit(self, process: Process, arrival_tick: int, ready_tick: int) -> None:
+        self.metrics.admit(process, arrival_tick, ready_tick)
+        if self.tracer is not None:
+            self.tracer.record(arrival_tick, process.pid, process.state, process.state, TraceEvent.ARRIVE)
+            self.tracer.record(ready_tick, process.pid, process.state, ProcessState.READY, TraceEvent.ADMIT)
+        self._enqueue(process)
 
     def _generate_new_task(self) -> None:
         if self.process_manager.is_table_full():
             self.next_task_to_load = None
             return
 
-        new_task = Process(size=self.default_process_size, program_length=self.program_length)
-        self.next_task_to_load = new_task
+        job = self.workload.next_job()
+        self.next_task_to_load = self._create_task(job) if job else None
 
-    def _load_next_task(self) -> bool:
-        task_to_load = self.next_task_to_load
+    def _create_task(self, job: Job) -> Process:
+        task = Process(size=job.size, program_length=job.program_length,
+                       priority=job.priority, io_duration=job.io_duration, program=job.program,
+                       pages=self._compile_pages(job.size, job.program_length),
+                       devices=self._compile_devices(job.program))
+        task.arrival_tick = job.arrival_tick
+        return task
 
-        if not task_to_load:
-            return False
+    def _compile_pages(self, size: int, program_length: int) -> Optional[array]:
+        if not self.paging:
+            return None
+        return self.workload.compile_pages(self.memory_manager.page_count(size), program_length)
+
+    def _compile_devices(self, program: bytes) -> Optional[bytes]:
+        if not self.io_devices:
+            return None
+        return self.workload.compile_devices(program, self._device_weights)
 
+    def _try_load(self, task: Process) -> bool:
         if self.process_manager.is_table_full():
             return False
 
-        if not self.memory_manager.has_enough_space(task_to_load.size):
+        # Распределитель сам решает, найдётся ли подходящий участок, и учитывает отказы
+        if not self.memory_manager.allocate(task.pid, task.size):
+            # Выгрузка освобождает память только по окончании обмена - тогда загрузка и повторится
+            self._swap_out_for(task.size)
             return False
 
-        self.process_manager.register_process(task_to_load)
+        self.process_manager.register_process(task)
+        return True
+
+    def _load_next_task(self) -> bool:
+        task_to_load = self.next_task_to_load
+
+        if not task_to_load:
+            return False
 
-        self.memory_manager.allocate(task_to_load.pid, task_to_load.size)
+        if not self._try_load(task_to_load):
+            return False
 
-        self.scheduler.add_process(task_to_load)
+        self._admit(task_to_load, self.tick_count + 1, self.tick_count + 1)
 
         self.next_task_to_load = None
 
         return True
 
-    def boot(self):
-        print("Загрузка ОС...")
-
-        self._generate_new_task()
-
-        print("Начальная загрузка процессов в память...")
-        while self._load_next_task():
+    def _admit_arrivals(self) -> None:
+        workload = self.workload
+        arrival_tick = workload.next_arrival_tick
+        while arrival_tick is not None and arrival_tick <= self.tick_count:
+            self.pending_tasks.append(self._create_task(workload.next_job()))
+            arrival_tick = workload.next_arrival_tick
+
+        # Задачи загружаются строго в порядке поступления; после отказа
+        # повторная попытка имеет смысл только когда какой-то процесс освободит ресурсы
+        pending_tasks = self.pending_tasks
+        # Процессы, ожидающие возврата из области подкачки, получают память раньше новых задач
+        while pending_tasks and not self._admission_blocked and not self.swap_in_queue:
+            if not self._try_load(pending_tasks[0]):
+                self._admission_blocked = True
+                break
+            task = pending_tasks.popleft()
+            self._admit(task, task.arrival_tick, self.tick_count)
+
+        self.next_task_to_load = pending_tasks[0] if pending_tasks else None
+
+    def _load_initial_tasks(self) -> None:
+        if self.workload.boot_only:
             self._generate_new_task()
+            while self._load_next_task():
+                self._generate_new_task()
+        self._booted = True
 
-        print("Начальная загрузка завершена. Запуск основного цикла симуляции.")
+    def boot(self, verbose: bool = True):
+        if verbose:
+            print("Загрузка ОС...")
+            print("Начальная загрузка процессов в память...")
+        self._load_initial_tasks()
+        self.publish_snapshot()
+
+        if verbose:
+            print("Начальная загрузка завершена. Запуск основного цикла симуляции.")
 
         self._running = True
         self.run()
@@ -75,49 +232,321 @@ class OperatingSystem:
     def shutdown(self):
         self._running = False
 
+    def close(self) -> None:
+        # Сбрасывает остаток трассы на диск; вызывается после остановки симуляции
+        if self.tracer is not None:
+            self.tracer.close(self.tick_count)
+
+    def __getstate__(self) -> Dict:
+        # Трасса (открытый файл и поток записи) и снимки для интерфейса в сохранённое состояние не входят
+        state = self.__dict__.copy()
+        state['tracer'] = None
+        state['profiler'] = None
+        state['pacer'] = None
+        state['_running'] = False
+        state['_lock'] = None
+        state['snapshots'] = None
+        state['_snapshot_interval'] = self.snapshots.interval
+        state['_snapshot_period'] = self.snapshots.period
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        interval = state.pop('_snapshot_interval')
+        period = state.pop('_snapshot_period', 0.1)
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self.snapshots = SnapshotPublisher(interval=interval, period=period)
+
+    def save_checkpoint(self, path: str) -> int:
+        # Счётчик pid общий для всех процессов класса - сохраняется вместе с системой
+        next_pid = next(Process._id_counter)
+        Process._id_counter = count(next_pid)
+
+        # Обёртки профилировщика - замыкания, их нельзя сохранить; на время сохранения они снимаются
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.detach()
+        try:
+            payload = zlib.compress(pickle.dumps((next_pid, self), protocol=pickle.HIGHEST_PROTOCOL))
+        finally:
+            if profiler is not None:
+                profiler.attach()
+        with open(path, "wb") as f:
+            f.write(_CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION))
+            f.write(payload)
+        return _CHECKPOINT_HEADER.size + len(payload)
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> "OperatingSystem":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < _CHECKPOINT_HEADER.size:
+            raise ValueError(f"Файл {path} не является контрольной точкой эмулятора.")
+        magic, version = _CHECKPOINT_HEADER.unpack_from(data)
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError(f"Файл {path} не является контрольной точкой эмулятора.")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия контрольной точки: {version}")
+
+        next_pid, os_emulator = pickle.loads(zlib.decompress(data[_CHECKPOINT_HEADER.size:]))
+        Process._id_counter = count(next_pid)
+        os_emulator.publish_snapshot()
+        return os_emulator
+
+    def enable_profiler(self) -> TickProfiler:
+        if self.profiler is None:
+            self.profiler = TickProfiler(self)
+            self.profiler.attach()
+        return self.profiler
+
+    def _start_pacer(self) -> Pacer:
+        # Часы и sleep берутся из модуля time при запуске, а не при импорте pacing
+        self.pacer = Pacer(clock=time.monotonic, sleep=time.sleep,
+                           resolution=self.pacing_resolution, max_batch=self.pacing_max_batch)
+        return self.pacer
+
+    def _advance(self, ticks: int) -> None:
+        with self._lock:
+            for _ in range(ticks):
+                self._tick()
+            if self.snapshots.due(self.tick_count, time.monotonic()):
+                self.publish_snapshot()
+
     def run(self):
+        pacer = self._start_pacer()
         while self._running:
-            self._handle_blocked_processes()
-
-            if self.active_process is None:
-                if self.scheduler.has_ready_processes:
-                    self.active_process = self.scheduler.get_next_process()
-                    if self.active_process:
-                        self.active_process.ticks_worked_in_quantum = 0
-                        self.active_process.state = ProcessState.RUNNING
-            if self.active_process is None and self.scheduler.has_ready_processes:
-                self.active_process = self.scheduler.get_next_process()
-                if self.active_process:
-                    self.active_process.ticks_worked_in_quantum = 0
-
-            if self.active_process:
-                process = self.active_process
-                process.state = ProcessState.RUNNING
+            self._advance(pacer.wait(self.speed_hz))
+
+    def run_for(self, ticks: int, event_driven: bool = False) -> Dict:
+        if not self._booted:
+            self._load_initial_tasks()
+
+        if event_driven:
+            self._run_events(self.tick_count + ticks)
+        else:
+            tick = self._tick
+            for _ in range(ticks):
+                tick()
+
+        self.publish_snapshot()
+        return self.get_system_stats()
+
+    def _run_events(self, end_tick: int) -> None:
+        # Отрезки выполнения без потактовой обработки - только для одного ядра;
+        # при нескольких ядрах пропускается лишь время полного простоя
+        single_core = self.cores[0] if self.cpu_count == 1 else None
+        while self.tick_count < end_tick:
+            if (self._all_cores_idle()
+                    and not (self.pending_tasks and not self._admission_blocked)
+                    and not (self.swap_in_queue and not self._swap_in_blocked)):
+                # Процессор простаивает: перематываем время до ближайшего события
+                next_event = self._next_event_tick()
+                if next_event is None:
+                    self.tick_count = end_tick
+                    return
+
+                idle_until = min(next_event - 1, end_tick)
+                if idle_until > self.tick_count:
+                    self.tick_count = idle_until
+                    continue
+
+            self._tick()
+
+            if single_core is not None and single_core.active_process is not None and self.tick_count < end_tick:
+                self._run_burst(single_core, end_tick - self.tick_count)
+
+    def _all_cores_idle(self) -> bool:
+        for core in self.cores:
+            if core.active_process is not None or core.scheduler.has_ready_processes:
+                return False
+        return True
 
-                result_signal = self.cpu.execute(process)
+    def _next_event_tick(self) -> Optional[int]:
+        # Ближайший такт, на котором что-то меняется без участия процессора
+        next_event = self.blocked_queue[0][0] if self.blocked_queue else None
+        for event_tick in (self.workload.next_arrival_tick, self._swap_outs[0][0] if self._swap_outs else None):
+            if event_tick is not None and (next_event is None or event_tick < next_event):
+                next_event = event_tick
+        return next_event
+
+    def _run_burst(self, core: Core, max_ticks: int) -> None:
+        # Продолжение кванта без посекундной обработки очереди блокировки:
+        # процесс выполняется до ввода-вывода, завершения или конца кванта.
+        process = core.active_process
+        scheduler = core.scheduler
+        if (scheduler.preemptive or self.swap_size) and self.blocked_queue:
+            # Пробуждение может вытеснить процесс или начать подкачку - останавливаемся перед ним
+            max_ticks = min(max_ticks, self.blocked_queue[0][0] - 1 - self.tick_count)
+        arrival_tick = self.workload.next_arrival_tick
+        if arrival_tick is not None:
+            # Новые задачи встают в очередь между пробуждениями - тоже событие
+            max_ticks = min(max_ticks, arrival_tick - 1 - self.tick_count)
+        if self._swap_outs:
+            # Окончание выгрузки освобождает память и открывает загрузку
+            max_ticks = min(max_ticks, self._swap_outs[0][0] - 1 - self.tick_count)
+        if max_ticks <= 0:
+            return
+
+        cpu = core.cpu
+        time_slice = scheduler.time_slice(process)
+        if scheduler.tick_preemption or self.paging:
+            # Вытеснение по времени и страничные прерывания проверяются на каждой команде
+            tick_preemption = scheduler.tick_preemption
+            result_signal = CommandType.COMPUTE
+            executed = 0
+            while executed < max_ticks:
+                if tick_preemption and scheduler.should_preempt(process):
+                    break
+                result_signal = cpu.execute(process)
                 process.ticks_worked_in_quantum += 1
+                executed += 1
+                if result_signal != CommandType.COMPUTE or process.ticks_worked_in_quantum >= time_slice:
+                    break
+        else:
+            # Программа заранее известна: отрезок до ввода-вывода, выхода или конца кванта
+            # вычисляется за один шаг
+            executed, result_signal = cpu.execute_burst(
+                process, min(max_ticks, time_slice - process.ticks_worked_in_quantum)
+            )
+            process.ticks_worked_in_quantum += executed
+
+        if executed == 0:
+            return
 
-                if result_signal == CommandType.IO:
-                    self._block_process_for_io(process)
-                elif result_signal == CommandType.EXIT:
-                    self._terminate_process(process)
-                elif process.ticks_worked_in_quantum >= self.quantum_length:
-                    self.scheduler.add_process(process)
-                    self.active_process = None
+        self.tick_count += executed
+        self._handle_blocked_processes()
+        self._complete_instruction(core, process, result_signal)
+
+    def _tick(self) -> None:
+        self.tick_count += 1
+        self._handle_blocked_processes()
+
+        if self._swap_outs and self._swap_outs[0][0] <= self.tick_count:
+            self._finish_swap_outs()
+
+        if self.swap_in_queue and not self._swap_in_blocked:
+            self._swap_in_ready()
+
+        if self.pending_tasks and not self._admission_blocked:
+            self._admit_arrivals()
+        else:
+            arrival_tick = self.workload.next_arrival_tick
+            if arrival_tick is not None and arrival_tick <= self.tick_count:
+                self._admit_arrivals()
+
+        # Сначала все ядра выбирают процессы, затем выполняют команду: процесс,
+        # вернувшийся в очередь на одном ядре, не может быть украден и выполнен повторно в том же такте
+        cores = self.cores
+        self.load_balancer.exhausted = False
+        for core in cores:
+            self._dispatch(core)
+
+        for core in cores:
+            process = core.active_process
+            if process is not None:
+                process.state = ProcessState.RUNNING
 
-            time.sleep(1.0 / self.speed_hz if self.speed_hz > 0 else 0.1)
+                result_signal = core.cpu.execute(process)
+                process.ticks_worked_in_quantum += 1
+                self._complete_instruction(core, process, result_signal)
 
+    def _dispatch(self, core: Core) -> None:
+        scheduler = core.scheduler
+        if core.active_process is not None and scheduler.preemptive and scheduler.should_preempt(core.active_process):
+            self._preempt_active_process(core)
+            self.load_balancer.exhausted = False
 
+        if core.active_process is not None:
+            return
 
-    def create_new_process(self, size: int) -> str:
+        if not scheduler.has_ready_processes:
+            stolen = self.load_balancer.steal(core)
+            if stolen is None:
+                return
+            scheduler.add_process(stolen)
+
+        process = scheduler.get_next_process()
+        if process:
+            core.active_process = process
+            process.ticks_worked_in_quantum = 0
+            self.metrics.dispatch(process, self.tick_count, core.index)
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count, process.pid, process.state,
+                                   ProcessState.RUNNING, TraceEvent.DISPATCH, core.index)
+
+    def _complete_instruction(self, core: Core, process: Process, result_signal: CommandType) -> None:
+        scheduler = core.scheduler
+        if result_signal == CommandType.IO:
+            scheduler.account(process, process.ticks_worked_in_quantum, quantum_expired=False)
+            self.metrics.stop(process, process.ticks_worked_in_quantum, core.index)
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count + 1, process.pid, process.state,
+                                   ProcessState.IO_WAIT, TraceEvent.IO, core.index)
+            core.active_process = None
+            self._block_process_for_io(process)
+        elif result_signal == CommandType.PAGE_FAULT:
+            scheduler.account(process, process.ticks_worked_in_quantum, quantum_expired=False)
+            self.metrics.stop(process, process.ticks_worked_in_quantum, core.index)
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count + 1, process.pid, process.state,
+                                   ProcessState.BLOCKED_MEM, TraceEvent.PAGE_FAULT, core.index)
+            core.active_process = None
+            self._block_process_for_page(process)
+        elif result_signal == CommandType.EXIT:
+            self.metrics.stop(process, process.ticks_worked_in_quantum, core.index)
+            self.metrics.complete(process, self.tick_count)
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count + 1, process.pid, process.state,
+                                   ProcessState.TERMINATED, TraceEvent.EXIT, core.index)
+            core.active_process = None
+            self._terminate_process(process)
+        elif process.ticks_worked_in_quantum >= scheduler.time_slice(process):
+            scheduler.account(process, process.ticks_worked_in_quantum, quantum_expired=True)
+            self.metrics.stop(process, process.ticks_worked_in_quantum, core.index)
+            self.metrics.requeue(process, self.tick_count + 1)
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count + 1, process.pid, process.state,
+                                   ProcessState.READY, TraceEvent.QUANTUM, core.index)
+            scheduler.add_process(process)
+            core.active_process = None
+
+    def _preempt_active_process(self, core: Core) -> None:
+        process = core.active_process
+        core.scheduler.account(process, process.ticks_worked_in_quantum, quantum_expired=False)
+        self.metrics.stop(process, process.ticks_worked_in_quantum, core.index)
+        self.metrics.requeue(process, self.tick_count)
+        if self.tracer is not None:
+            self.tracer.record(self.tick_count, process.pid, process.state,
+                               ProcessState.READY, TraceEvent.PREEMPT, core.index)
+        core.scheduler.add_process(process)
+        core.active_process = None
+
+    def create_new_process(self, size: int, priority: int = 0, affinity: Optional[List[int]] = None) -> str:
+        # Команда интерфейса выполняется между пачками тактов; интерфейс перерисовывается сразу
+        # после неё, поэтому снимок с новым процессом публикуется здесь же
+        with self._lock:
+            result = self._create_process(size, priority, affinity)
+            self.publish_snapshot()
+        return result
+
+    def _create_process(self, size: int, priority: int, affinity: Optional[List[int]]) -> str:
         if self.process_manager.is_table_full():
             return "Ошибка: Таблица процессов заполнена."
 
+        if affinity is not None and not all(0 <= core < self.cpu_count for core in affinity):
+            return f"Ошибка: Номер ядра должен быть от 0 до {self.cpu_count - 1}."
+
         if not self.memory_manager.has_enough_space(size):
+            if self._swap_out_for(size):
+                return (f"Ошибка: Недостаточно памяти. Память освобождается выгрузкой в область подкачки - "
+                        f"повторите после такта {self._swap_free_tick}.")
             return f"Ошибка: Недостаточно памяти. Требуется {size}, доступно {self.memory_manager.total_size - self.memory_manager.used_memory}."
 
+        program = self.workload.compile_program(self.program_length)
         new_process = self.process_manager.create_and_register_process(
-            size=size, program_length=self.program_length
+            size=size, program_length=self.program_length, priority=priority, program=program,
+            pages=self._compile_pages(size, self.program_length), devices=self._compile_devices(program)
         )
 
         if new_process is None:
@@ -127,56 +556,294 @@ class OperatingSystem:
             self.process_manager.remove_process(new_process.pid)
             return "Ошибка: Не удалось выделить память."
 
-        self.scheduler.add_process(new_process)
+        if affinity is not None:
+            new_process.affinity = frozenset(affinity)
+
+        self._admit(new_process, self.tick_count + 1, self.tick_count + 1)
 
         return f"Процесс {new_process.pid} успешно создан."
 
 
-    def get_system_stats(self) -> Dict:
+    def publish_snapshot(self) -> SystemSnapshot:
+        # Вызывается потоком симуляции или под self._lock; перцентили метрик в снимок не входят - их сортировка дорога
+        stats = self.get_system_stats(include_metrics=False)
+        processes = stats.pop("all_processes")
+        next_task = stats.pop("next_task")
+        io_remaining = stats.pop("io_remaining")
+        stats["completed"] = self.metrics.completed
+        return self.snapshots.publish(self.tick_count, time.monotonic(), stats, processes, next_task, io_remaining)
+
+    def latest_snapshot(self) -> Optional[SystemSnapshot]:
+        # Безопасно для любого потока: возвращает последний опубликованный неизменяемый снимок
+        return self.snapshots.latest()
+
+    def get_system_stats(self, include_metrics: bool = True) -> Dict:
+        # Остаток ожидания I/O вычисляется по абсолютному такту пробуждения; сами процессы не меняются
+        io_remaining = {process.pid: wakeup_tick - self.tick_count for wakeup_tick, _, process in self.blocked_queue}
+
         all_processes = list(self.process_manager.process_table.values())
-        cpu_state = "Работа" if self.active_process else "Ожидание"
+        running = [core.active_process for core in self.cores]
+        busy_cores = sum(process is not None for process in running)
+        if self.cpu_count == 1:
+            cpu_state = "Работа" if busy_cores else "Ожидание"
+        else:
+            cpu_state = f"Работа {busy_cores}/{self.cpu_count}" if busy_cores else "Ожидание"
 
         last_command = self.cpu.last_executed_command if self.cpu.last_executed_command else "N/A"
 
         stats = {
+            "tick": self.tick_count,
+            "seed": self.seed,
             "speed_hz": round(self.speed_hz, 2),
             "memory_usage": f"{self.memory_manager.used_memory}/{self.memory_manager.total_size}",
+            "memory": self.memory_manager.stats(),
             "process_count": f"{len(self.process_manager.process_table)}/{self.process_manager.max_processes}",
             "all_processes": all_processes,
             "next_task": self.next_task_to_load,
-            "active_pid": self.active_process.pid if self.active_process else "N/A",
+            "io_remaining": io_remaining,
+            "active_pid": ", ".join(str(process.pid) for process in running if process) or "N/A",
+            "cores": [
+                {"core": core.index, "pid": process.pid if process else None, "ready": len(core.scheduler)}
+                for core, process in zip(self.cores, running)
+            ],
             "cpu_state": cpu_state,
             "blocked_count": len(self.blocked_queue),
-            "last_command": str(last_command)
+            "pending_count": len(self.pending_tasks),
+            "suspended_count": len(self.swapped),
+            "swap_usage": f"{self.swap_used}/{self.swap_size}",
+            "io_devices": {device.name: device.stats(self.tick_count) for device in self.io_devices},
+            "last_command": str(last_command),
         }
+        if self.tracer is not None:
+            stats["trace"] = self.tracer.stats()
+        if self.pacer is not None:
+            stats["pacing"] = self.pacer.stats()
+        if self.profiler is not None:
+            stats["profile"] = self.profiler.report()
+        if include_metrics:
+            stats["metrics"] = self.metrics.summary(
+                self.tick_count, [process.ticks_worked_in_quantum if process else 0 for process in running]
+            )
         return stats
 
     def change_speed(self, factor: float):
         new_speed = self.speed_hz * factor
-        self.speed_hz = max(0.1, min(1000.0, new_speed))
+        with self._lock:
+            self.speed_hz = max(0.1, min(self.max_speed_hz, new_speed))
+            self.publish_snapshot()
 
     def _handle_blocked_processes(self) -> None:
-        processes_to_unblock = []
-        for process in self.blocked_queue:
-            process.io_time_remaining -= 1
-            if process.io_time_remaining <= 0:
-                processes_to_unblock.append(process)
-
-        for process in processes_to_unblock:
-            self.blocked_queue.remove(process)
+        blocked_queue = self.blocked_queue
+        while blocked_queue and blocked_queue[0][0] <= self.tick_count:
+            wakeup_tick, _, process = heapq.heappop(blocked_queue)
+            process.io_time_remaining = 0
+            if process.io_device >= 0:
+                # Устройство освободилось - начинаем следующий запрос с момента завершения этого
+                device = self.io_devices[process.io_device]
+                process.io_device = -1
+                device.finish()
+                self._start_device(device, wakeup_tick)
+            if self._swap_candidate_ids:
+                self._remove_swap_candidate(process.pid)
+            # Внутри отрезка событийного движка процесс мог проснуться раньше текущего такта
+            self.metrics.wake(process, wakeup_tick)
+            if process.state == ProcessState.SUSPENDED:
+                # Ввод-вывод завершён, но образ процесса в области подкачки - ждёт загрузки
+                if self.tracer is not None:
+                    self.tracer.record(wakeup_tick, process.pid, process.state, ProcessState.SUSPENDED, TraceEvent.WAKE)
+                self.swap_in_queue.append(process)
+                self._swap_in_blocked = False
+                continue
+            if self.tracer is not None:
+                self.tracer.record(wakeup_tick, process.pid, process.state, ProcessState.READY, TraceEvent.WAKE)
             process.state = ProcessState.READY
-            self.scheduler.add_process(process)
+            self._enqueue(process)
 
     def _block_process_for_io(self, process: Process) -> None:
+        if self.io_devices:
+            self._submit_io(process)
+        else:
+            io_duration = process.io_duration if process.io_duration is not None else self.io_duration
+            self._block_process(process, ProcessState.IO_WAIT, io_duration)
+
+    def _submit_io(self, process: Process) -> None:
+        # Запрос встаёт в очередь устройства; в очередь пробуждений процесс попадает,
+        # когда устройство начнёт его обслуживать
+        index = process.devices[process.program_counter - 1] if process.devices else 0
+        device = self.io_devices[index]
         process.state = ProcessState.IO_WAIT
-        process.io_time_remaining = self.io_duration
-        self.blocked_queue.append(process)
-        self.active_process = None
+        process.io_device = index
+        process.io_time_remaining = 0
+        self.metrics.block(process, self.tick_count + 1)
+        device.submit(process, self.tick_count)
+        self._start_device(device, self.tick_count)
+
+    def _start_device(self, device: IODevice, tick: int) -> None:
+        started = device.start_next(tick)
+        while started is not None:
+            process, completion_tick = started
+            process.io_time_remaining = completion_tick - self.tick_count
+            self._blocked_sequence += 1
+            heapq.heappush(self.blocked_queue, (completion_tick, self._blocked_sequence, process))
+            if self.swap_size:
+                self._add_swap_candidate(completion_tick, self._blocked_sequence, process)
+            started = device.start_next(tick)
+
+    def _block_process_for_page(self, process: Process) -> None:
+        # Страница загружается сразу, процесс ждёт окончания подкачки и повторяет команду
+        memory_manager = self.memory_manager
+        memory_manager.handle_page_fault(process.pid, process.pages[process.program_counter])
+        self._block_process(process, ProcessState.BLOCKED_MEM, memory_manager.fault_latency)
+
+    def _block_process(self, process: Process, state: ProcessState, duration: int) -> None:
+        process.state = state
+        self.metrics.block(process, self.tick_count + 1)
+        process.io_time_remaining = duration
+        wakeup_tick = self.tick_count + max(duration, 1)
+        self._blocked_sequence += 1
+        heapq.heappush(self.blocked_queue, (wakeup_tick, self._blocked_sequence, process))
+        if self.swap_size and state == ProcessState.IO_WAIT:
+            self._add_swap_candidate(wakeup_tick, self._blocked_sequence, process)
 
     def _terminate_process(self, process: Process) -> None:
         pid = process.pid
         self.memory_manager.free(pid)
-        self.scheduler.remove_process(pid)
+        self._admission_blocked = False
+        self._swap_in_blocked = False
         self.process_manager.remove_process(pid)
-        if self.active_process and self.active_process.pid == pid:
-            self.active_process = None
+
+    def _swap_transfer(self) -> int:
+        # Область подкачки обслуживает обмены по одному, каждый занимает swap_latency тактов
+        start = max(self.tick_count, self._swap_free_tick)
+        self._swap_free_tick = start + max(self.swap_latency, 1)
+        return self._swap_free_tick
+
+    def _add_swap_candidate(self, wakeup_tick: int, sequence: int, process: Process) -> None:
+        # Процесс, который проснётся раньше окончания обмена, выгружать бессмысленно - и позже не станет
+        if wakeup_tick <= self.tick_count + max(self.swap_latency, 1):
+            return
+
+        reclaimable = self.memory_manager.reclaimable(process.pid)
+        self._swap_candidate_ids[process.pid] = (sequence, reclaimable)
+        self._swappable += reclaimable
+        candidates = self._swap_candidates
+        heapq.heappush(candidates, (-wakeup_tick, sequence, process))
+        if len(candidates) > 2 * len(self._swap_candidate_ids) + 64:
+            # Устаревших записей стало больше живых - куча пересобирается
+            candidate_ids = self._swap_candidate_ids
+            candidates[:] = [entry for entry in candidates
+                             if candidate_ids.get(entry[2].pid, (None,))[0] == entry[1]]
+            heapq.heapify(candidates)
+
+        # Объём освобождаемой памяти вырос - отложенные загрузки можно повторить
+        self._admission_blocked = False
+        self._swap_in_blocked = False
+
+    def _remove_swap_candidate(self, pid: int) -> int:
+        entry = self._swap_candidate_ids.pop(pid, None)
+        if entry is None:
+            return 0
+        self._swappable -= entry[1]
+        return entry[1]
+
+    def _swap_out_for(self, size: int) -> bool:
+        # True - запрос поместится, когда завершатся начатые обмены. Выгружаются ждущие дольше всех,
+        # и ровно столько, сколько нужно распределителю; если запрос не помещается и после выгрузки
+        # всех кандидатов, выгрузка не начинается
+        if not self.swap_size:
+            return False
+
+        memory_manager = self.memory_manager
+        if memory_manager.free_space + self._swapping_out + self._swappable < size:
+            return False
+        pids = [process.pid for _, process, _ in self._swap_outs]
+        if pids and memory_manager.fits_after_free(pids, size):
+            return True
+
+        # Кандидаты снимаются с кучи по убыванию такта пробуждения; каждый должен проснуться
+        # после окончания своего обмена, а обмены идут по одному
+        candidates = self._swap_candidates
+        candidate_ids = self._swap_candidate_ids
+        latency = max(self.swap_latency, 1)
+        transfer_end = max(self.tick_count, self._swap_free_tick) + latency
+        swap_free = self.swap_size - self.swap_used
+        taken: List[Tuple[int, int, Process]] = []
+        victims: List[int] = []
+        while candidates:
+            wakeup, sequence, process = candidates[0]
+            if candidate_ids.get(process.pid, (None,))[0] != sequence:
+                heapq.heappop(candidates)
+                continue
+            if -wakeup <= transfer_end:
+                break
+            taken.append(heapq.heappop(candidates))
+            if process.size > swap_free:
+                continue
+            victims.append(process.pid)
+            swap_free -= process.size
+            transfer_end += latency
+
+        # Наименьшее число жертв: проверка монотонна - чем больше освобождено, тем не хуже
+        count = 0
+        if victims and memory_manager.fits_after_free(pids + victims, size):
+            low, count = 1, len(victims)
+            while low < count:
+                middle = (low + count) // 2
+                if memory_manager.fits_after_free(pids + victims[:middle], size):
+                    count = middle
+                else:
+                    low = middle + 1
+
+        chosen = set(victims[:count])
+        for entry in taken:
+            if entry[2].pid in chosen:
+                self._swap_out(entry[2])
+            else:
+                heapq.heappush(candidates, entry)
+        return count > 0
+
+    def _swap_out(self, process: Process) -> None:
+        # Процесс приостанавливается сразу, а его память освобождается по окончании обмена
+        reclaimable = self._remove_swap_candidate(process.pid)
+        if self.tracer is not None:
+            self.tracer.record(self.tick_count, process.pid, process.state, ProcessState.SUSPENDED, TraceEvent.SWAP_OUT)
+        process.state = ProcessState.SUSPENDED
+        self.swapped[process.pid] = process
+        self.swap_used += process.size
+        self._swapping_out += reclaimable
+        self._swap_outs.append((self._swap_transfer(), process, reclaimable))
+        self.metrics.swap_out(process)
+
+    def _finish_swap_outs(self) -> None:
+        swap_outs = self._swap_outs
+        while swap_outs and swap_outs[0][0] <= self.tick_count:
+            _, process, reclaimable = swap_outs.popleft()
+            self.memory_manager.free(process.pid)
+            self._swapping_out -= reclaimable
+        self._admission_blocked = False
+        self._swap_in_blocked = False
+
+    def _swap_in_ready(self) -> None:
+        memory_manager = self.memory_manager
+        swap_in_queue = self.swap_in_queue
+        while swap_in_queue:
+            process = swap_in_queue[0]
+            if not memory_manager.allocate(process.pid, process.size):
+                self._swap_out_for(process.size)
+                self._swap_in_blocked = True
+                return
+
+            swap_in_queue.popleft()
+            del self.swapped[process.pid]
+            self.swap_used -= process.size
+            self.metrics.swap_in(process)
+
+            # Процесс загружается обратно и становится готовым по окончании обмена
+            if self.tracer is not None:
+                self.tracer.record(self.tick_count, process.pid, process.state,
+                                   ProcessState.LOADING, TraceEvent.SWAP_IN)
+            process.state = ProcessState.LOADING
+            wakeup_tick = self._swap_transfer()
+            process.io_time_remaining = wakeup_tick - self.tick_count
+            self._blocked_sequence += 1
+            heapq.heappush(self.blocked_queue, (wakeup_tick, self._blocked_sequence, process))
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Callable, Optional, Tuple
+
+from .os import OperatingSystem
+
+# Команда выполняется в цикле симуляции между пачками тактов и возвращает сообщение для пользователя
+ControlCommand = Callable[[OperatingSystem], Optional[str]]
+
+
+class AsyncRuntime:
+    # Симуляция и обработчик команд - сопрограммы одного цикла событий. Состояние системы
+    # меняется только в этом цикле: интерфейсы не вызывают методы ОС напрямую, а кладут
+    # команды в очередь. Несколько систем могут работать в одном цикле одновременно.
+    def __init__(self, os_emulator: OperatingSystem):
+        self.os = os_emulator
+        self.commands: asyncio.Queue[Tuple[ControlCommand, asyncio.Future]] = asyncio.Queue()
+
+    async def submit(self, command: ControlCommand) -> Optional[str]:
+        future = asyncio.get_running_loop().create_future()
+        await self.commands.put((command, future))
+        return await future
+
+    def stop(self) -> None:
+        self.os.shutdown()
+
+    async def _handle_commands(self) -> None:
+        while True:
+            command, future = await self.commands.get()
+            if future.cancelled():
+                continue
+            try:
+                result = command(self.os)
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                # Результат команды виден в следующем снимке сразу, а не после очередного такта
+                self.os.publish_snapshot()
+                future.set_result(result)
+
+    async def _simulate(self) -> None:
+        os_emulator = self.os
+        pacer = os_emulator._start_pacer()
+        while os_emulator._running:
+            os_emulator._advance(pacer.take(os_emulator.speed_hz))
+            # Ожидание отдаёт цикл командам и другим системам; при отставании - нулевое
+            await asyncio.sleep(pacer.delay())
+
+    async def run(self) -> None:
+        os_emulator = self.os
+        if not os_emulator._booted:
+            os_emulator._load_initial_tasks()
+            os_emulator.publish_snapshot()
+
+        os_emulator._running = True
+        handler = asyncio.create_task(self._handle_commands())
+        try:
+            await self._simulate()
+        finally:
+            handler.cancel()
+            # Команды, не дождавшиеся выполнения, отменяются
+            while not self.commands.empty():
+                _, future = self.commands.get_nowait()
+                future.cancel()
@@ -0,0 +1,207 @@
+import math
+import random
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from ..core.process import Process
+from .workload import Distribution
+
+DEVICE_TYPES = ("disk", "network", "terminal")
+DISK_SCHEDULERS = ("fcfs", "sstf", "scan", "cscan", "look")
+
+# Параметры по умолчанию для каждого типа устройства
+_DEVICE_DEFAULTS = {
+    "disk": {"concurrency": 1, "service": 5},
+    "network": {"concurrency": 4, "service": {"dist": "exp", "mean": 20}},
+    "terminal": {"concurrency": 1, "service": 30},
+}
+
+
+class IORequest:
+    __slots__ = ("process", "submit_tick", "sequence", "cylinder")
+
+    def __init__(self, process: Process, submit_tick: int, sequence: int, cylinder: int = 0):
+        self.process: Process = process
+        self.submit_tick: int = submit_tick
+        self.sequence: int = sequence
+        self.cylinder: int = cylinder
+
+
+class IODevice:
+    # Устройство с очередью запросов и ограничением на число одновременно обслуживаемых
+    def __init__(self, name: str, kind: str, concurrency: int, service: Distribution, rng: random.Random):
+        if concurrency < 1:
+            raise ValueError(f"Устройство {name}: число одновременных запросов должно быть не меньше 1.")
+
+        self.name: str = name
+        self.kind: str = kind
+        self.concurrency: int = concurrency
+        self.service: Distribution = service
+        self.rng: random.Random = rng
+        self.in_service: int = 0
+        self._sequence: int = 0
+        self._queue: deque[IORequest] = deque()
+
+        self.completed: int = 0
+        self.busy_ticks: int = 0
+        self.queue_wait_ticks: int = 0
+        self.max_queue: int = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, process: Process, tick: int) -> None:
+        self._sequence += 1
+        self._enqueue(IORequest(process, tick, self._sequence, self._request_cylinder()))
+        self.max_queue = max(self.max_queue, len(self))
+
+    def _request_cylinder(self) -> int:
+        return 0
+
+    def _enqueue(self, request: IORequest) -> None:
+        self._queue.append(request)
+
+    def _select(self) -> IORequest:
+        return self._queue.popleft()
+
+    def _service_time(self, request: IORequest) -> int:
+        return max(1, self.service.sample(self.rng))
+
+    def start_next(self, tick: int) -> Optional[Tuple[Process, int]]:
+        # Начинает обслуживание следующего запроса; возвращает процесс и такт завершения
+        if self.in_service >= self.concurrency or not len(self):
+            return None
+
+        request = self._select()
+        duration = self._service_time(request)
+        self.in_service += 1
+        self.busy_ticks += duration
+        self.queue_wait_ticks += tick - request.submit_tick
+        return request.process, tick + duration
+
+    def finish(self) -> None:
+        self.in_service -= 1
+        self.completed += 1
+
+    def stats(self, tick: int) -> Dict:
+        return {
+            "type": self.kind,
+            "queue": len(self),
+            "in_service": f"{self.in_service}/{self.concurrency}",
+            "completed": self.completed,
+            "utilisation": round(self.busy_ticks / (tick * self.concurrency), 4) if tick else 0.0,
+            "mean_queue_wait": round(self.queue_wait_ticks / self.completed, 3) if self.completed else 0.0,
+            "max_queue": self.max_queue,
+        }
+
+
+class DiskDevice(IODevice):
+    # Диск с головкой над одним из цилиндров: время обслуживания = перемещение головки + передача.
+    # Ожидающие запросы упорядочены по цилиндру, выбор следующего - двоичный поиск от головки.
+    def __init__(self, name: str, concurrency: int, service: Distribution, rng: random.Random,
+                 policy: str = "fcfs", cylinders: int = 200, seek_time: float = 0.1):
+        super().__init__(name, "disk", concurrency, service, rng)
+        if policy not in DISK_SCHEDULERS:
+            raise ValueError(f"Неизвестный алгоритм планирования диска: {policy}")
+
+        self.policy: str = policy
+        self.cylinders: int = cylinders
+        self.seek_time: float = seek_time
+        self.head: int = 0
+        self.direction: int = 1
+        self.seek_distance: int = 0
+        # Путь головки до края диска при развороте - добавляется к следующему обслуживанию
+        self._travel: int = 0
+        self._by_cylinder: List[Tuple[int, int, IORequest]] = []
+
+    def __len__(self) -> int:
+        return len(self._by_cylinder) if self.policy != "fcfs" else len(self._queue)
+
+    def _request_cylinder(self) -> int:
+        return self.rng.randrange(self.cylinders)
+
+    def _enqueue(self, request: IORequest) -> None:
+        if self.policy == "fcfs":
+            self._queue.append(request)
+        else:
+            insort(self._by_cylinder, (request.cylinder, request.sequence, request))
+
+    def _take(self, index: int) -> IORequest:
+        return self._by_cylinder.pop(index)[2]
+
+    def _select(self) -> IORequest:
+        if self.policy == "fcfs":
+            return self._queue.popleft()
+
+        pending = self._by_cylinder
+        head = self.head
+        above = bisect_left(pending, (head, 0))
+
+        if self.policy == "sstf":
+            if above == len(pending):
+                return self._take(above - 1)
+            if above == 0 or pending[above][0] - head <= head - pending[above - 1][0]:
+                return self._take(above)
+            return self._take(above - 1)
+
+        if self.policy == "cscan":
+            # Только в сторону больших цилиндров; в конце головка возвращается к нулевому
+            if above == len(pending):
+                self._travel += (self.cylinders - 1 - head) + (self.cylinders - 1)
+                self.head = head = 0
+                above = 0
+            return self._take(above)
+
+        # SCAN и LOOK: движение до последнего запроса (LOOK) или до края диска (SCAN), затем разворот
+        if self.direction > 0 and above == len(pending):
+            if self.policy == "scan":
+                self._travel += self.cylinders - 1 - head
+                self.head = self.cylinders - 1
+            self.direction = -1
+        elif self.direction < 0 and (above == 0 and pending[0][0] > head):
+            if self.policy == "scan":
+                self._travel += head
+                self.head = 0
+            self.direction = 1
+
+        if self.direction > 0:
+            return self._take(bisect_left(pending, (self.head, 0)))
+        below = bisect_left(pending, (self.head + 1, 0)) - 1
+        return self._take(below)
+
+    def _service_time(self, request: IORequest) -> int:
+        distance = self._travel + abs(request.cylinder - self.head)
+        self._travel = 0
+        self.seek_distance += distance
+        self.head = request.cylinder
+        return max(1, math.ceil(distance * self.seek_time) + self.service.sample(self.rng))
+
+    def stats(self, tick: int) -> Dict:
+        stats = super().stats(tick)
+        stats.update({"scheduler": self.policy, "head": self.head, "seek_distance": self.seek_distance})
+        return stats
+
+
+def create_io_devices(config: Dict, seed: int) -> List[IODevice]:
+    # Порядок устройств совпадает с порядком в конфигурации: номер устройства хранится в программе
+    rng = random.Random(f"{seed}:io")
+    devices = []
+    for name, spec in config.get('io_devices', {}).items():
+        kind = spec.get("type", name)
+        if kind not in DEVICE_TYPES:
+            raise ValueError(f"Неизвестный тип устройства ввода-вывода: {kind}")
+
+        defaults = _DEVICE_DEFAULTS[kind]
+        concurrency = spec.get("concurrency", defaults["concurrency"])
+        service = Distribution(spec.get("service", defaults["service"]), minimum=0)
+        if kind == "disk":
+            devices.append(DiskDevice(name, concurrency, service, rng, policy=spec.get("scheduler", "fcfs"),
+                                      cylinders=spec.get("cylinders", 200), seek_time=spec.get("seek_time", 0.1)))
+        else:
+            devices.append(IODevice(name, kind, concurrency, service, rng))
+    return devices
+
+
+def device_weights(config: Dict) -> List[float]:
+    return [spec.get("weight", 1.0) for spec in config.get('io_devices', {}).values()]
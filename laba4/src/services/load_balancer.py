@@ -0,0 +1,77 @@
+from typing import List, Optional
+
+from ..core.cpu import CPU
+from ..core.process import Process
+
+
+class Core:
+    # Ядро процессора: собственный CPU, выполняемый процесс и локальная очередь готовых
+    __slots__ = ("index", "cpu", "scheduler", "active_process")
+
+    def __init__(self, index: int, cpu: CPU, scheduler):
+        self.index: int = index
+        self.cpu: CPU = cpu
+        self.scheduler = scheduler
+        self.active_process: Optional[Process] = None
+
+    @property
+    def load(self) -> int:
+        return len(self.scheduler) + (self.active_process is not None)
+
+    def __repr__(self) -> str:
+        pid = self.active_process.pid if self.active_process else None
+        return f"Core(index={self.index}, pid={pid}, ready={len(self.scheduler)})"
+
+
+class LoadBalancer:
+    def __init__(self, cores: List[Core], work_stealing: bool = True):
+        self.cores: List[Core] = cores
+        self.work_stealing: bool = work_stealing
+        self.steals: int = 0
+        # Выставляется, когда все очереди пусты; сбрасывается при появлении готовых процессов
+        self.exhausted: bool = False
+
+    def allowed(self, process: Process, core: Core) -> bool:
+        return process.affinity is None or core.index in process.affinity
+
+    def select_core(self, process: Process) -> Core:
+        cores = self.cores
+        if len(cores) == 1:
+            return cores[0]
+
+        if process.affinity is not None:
+            cores = [cores[index] for index in sorted(process.affinity)]
+
+        # Наименее загруженное ядро; при равной загрузке - то, где процесс выполнялся в прошлый раз
+        best = min(cores, key=lambda core: (core.load, core.index != process.last_core, core.index))
+        return best
+
+    def steal(self, thief: Core) -> Optional[Process]:
+        # Простаивающее ядро забирает следующий готовый процесс у самой загруженной очереди
+        if not self.work_stealing or self.exhausted or len(self.cores) == 1:
+            return None
+
+        victim = None
+        for core in self.cores:
+            if core is not thief and (victim is None or len(core.scheduler) > len(victim.scheduler)):
+                victim = core
+        if victim is None or not victim.scheduler.has_ready_processes:
+            self.exhausted = True
+            return None
+
+        process = victim.scheduler.peek()
+        if not self.allowed(process, thief):
+            # Голова самой длинной очереди привязана к другим ядрам - ищем среди остальных
+            process = None
+            for core in self.cores:
+                if core is not thief and core.scheduler.has_ready_processes:
+                    candidate = core.scheduler.peek()
+                    if self.allowed(candidate, thief):
+                        victim, process = core, candidate
+                        break
+            if process is None:
+                return None
+
+        victim.scheduler.remove_process(process.pid)
+        self.steals += 1
+        return process
@@ -0,0 +1,127 @@
+import math
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from ..core.process import Process, ProcessState
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Метод ближайшего ранга: наименьшее значение, не меньше которого доля fraction выборки
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return float(sorted_values[index])
+
+
+def _distribution(values: array) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "mean": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+    }
+
+
+class MetricsCollector:
+    # Такты считаются только на переходах состояний, поэтому сбор не добавляет работы в такт.
+    # Время процесса в системе = ожидание допуска + cpu_ticks + io_wait_ticks + memory_wait_ticks + ready_wait_ticks.
+    def __init__(self, cpu_count: int = 1):
+        self.core_busy_ticks: List[int] = [0] * cpu_count
+        self.context_switches: int = 0
+        self.migrations: int = 0
+        self._last_dispatched_pid: List[Optional[int]] = [None] * cpu_count
+
+        self.arrival_ticks = array('q')
+        self.first_run_ticks = array('q')
+        self.completion_ticks = array('q')
+        self.cpu_ticks = array('q')
+        self.io_wait_ticks = array('q')
+        self.memory_wait_ticks = array('q')
+        self.ready_wait_ticks = array('q')
+        self.admission_ticks = array('q')
+
+        self.swap_outs: int = 0
+        self.swap_ins: int = 0
+        self.swap_bytes: int = 0
+
+    def admit(self, process: Process, arrival_tick: int, ready_tick: int) -> None:
+        # Между поступлением и загрузкой в память задача ждёт в очереди допуска
+        process.arrival_tick = arrival_tick
+        process.state_since = ready_tick
+        self.admission_ticks.append(ready_tick - arrival_tick)
+
+    def dispatch(self, process: Process, tick: int, core: int = 0) -> None:
+        process.ready_wait_ticks += tick - process.state_since
+        if process.first_run_tick < 0:
+            process.first_run_tick = tick
+        if process.pid != self._last_dispatched_pid[core]:
+            self.context_switches += 1
+            self._last_dispatched_pid[core] = process.pid
+        if process.last_core != core:
+            if process.last_core >= 0:
+                self.migrations += 1
+            process.last_core = core
+
+    def stop(self, process: Process, ticks_run: int, core: int = 0) -> None:
+        process.cpu_ticks += ticks_run
+        self.core_busy_ticks[core] += ticks_run
+
+    def requeue(self, process: Process, tick: int) -> None:
+        process.state_since = tick
+
+    def block(self, process: Process, tick: int) -> None:
+        process.state_since = tick
+
+    def wake(self, process: Process, tick: int) -> None:
+        if process.state in (ProcessState.BLOCKED_MEM, ProcessState.LOADING):
+            process.memory_wait_ticks += tick - process.state_since
+        else:
+            process.io_wait_ticks += tick - process.state_since
+        process.state_since = tick
+
+    def swap_out(self, process: Process) -> None:
+        self.swap_outs += 1
+        self.swap_bytes += process.size
+
+    def swap_in(self, process: Process) -> None:
+        self.swap_ins += 1
+        self.swap_bytes += process.size
+
+    def complete(self, process: Process, tick: int) -> None:
+        process.completion_tick = tick
+        self.arrival_ticks.append(process.arrival_tick)
+        self.first_run_ticks.append(process.first_run_tick)
+        self.completion_ticks.append(tick)
+        self.cpu_ticks.append(process.cpu_ticks)
+        self.io_wait_ticks.append(process.io_wait_ticks)
+        self.memory_wait_ticks.append(process.memory_wait_ticks)
+        self.ready_wait_ticks.append(process.ready_wait_ticks)
+
+    @property
+    def completed(self) -> int:
+        return len(self.completion_ticks)
+
+    def summary(self, tick: int, running_ticks: Sequence[int] = ()) -> Dict:
+        # running_ticks - такты текущего кванта на каждом ядре, ещё не учтённые в stop
+        completed = self.completed
+        turnaround = array('q', (self.completion_ticks[i] - self.arrival_ticks[i] + 1 for i in range(completed)))
+        response = array('q', (self.first_run_ticks[i] - self.arrival_ticks[i] for i in range(completed)))
+        core_busy_ticks = list(self.core_busy_ticks)
+        for core, ticks in enumerate(running_ticks):
+            core_busy_ticks[core] += ticks
+        busy_ticks = sum(core_busy_ticks)
+        cpu_count = len(core_busy_ticks)
+
+        return {
+            "completed": completed,
+            "cpu_utilisation": round(busy_ticks / (tick * cpu_count), 4) if tick else 0.0,
+            "core_utilisation": [round(ticks / tick, 4) if tick else 0.0 for ticks in core_busy_ticks],
+            "throughput_per_1000_ticks": round(completed * 1000 / tick, 3) if tick else 0.0,
+            "turnaround": _distribution(turnaround),
+            "response": _distribution(response),
+            "context_switches": self.context_switches,
+            "migrations": self.migrations,
+            "admission_latency": _distribution(self.admission_ticks),
+            "swap": {"out": self.swap_outs, "in": self.swap_ins, "bytes": self.swap_bytes},
+        }
@@ -0,0 +1,243 @@
+from typing import Dict, List, Sequence
+
+from ..core.command import CommandType
+from ..core.memory import create_memory_manager
+from .metrics import _distribution
+from .workload import Workload
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость
+    np = None
+
+# Состояния процесса в таблице структур массивов
+EMPTY, READY, RUNNING, BLOCKED, TERMINATED = 0, 1, 2, 3, 4
+
+_COMPUTE = CommandType.COMPUTE.value
+_IO = CommandType.IO.value
+_EXIT = CommandType.EXIT.value
+_NEVER = np.iinfo(np.int64).max if np is not None else 0
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Для векторного движка требуется numpy: pip install numpy")
+
+
+def _boot_jobs(config: Dict) -> List:
+    # Тот же генератор и тот же порядок загрузки, что и у OperatingSystem._load_initial_tasks
+    workload = Workload(config, config['seed'])
+    memory = create_memory_manager(config)
+    jobs = []
+    while len(jobs) < config['max_processes']:
+        job = workload.next_job()
+        if job is None or not memory.allocate(len(jobs), job.size):
+            break
+        jobs.append(job)
+    return jobs
+
+
+class BatchSimulation:
+    # Пакет независимых симуляций round-robin: ось 0 - симуляция, ось 1 - слот процесса
+    def __init__(self, configs: Sequence[Dict]):
+        _require_numpy()
+
+        for config in configs:
+            if config.get('scheduler', 'rr') != 'rr':
+                raise ValueError("Векторный движок поддерживает только планировщик rr.")
+            if config.get('workload', {}).get('arrival', {"process": "boot"}).get("process", "boot") != "boot":
+                raise ValueError("Векторный движок поддерживает только начальную загрузку задач (arrival=boot).")
+            if config.get('memory_allocator') == 'paging':
+                raise ValueError("Векторный движок не моделирует страничную память.")
+            if config.get('io_devices'):
+                raise ValueError("Векторный движок не моделирует устройства ввода-вывода.")
+            if config.get('cpu_count', 1) != 1:
+                raise ValueError("Векторный движок моделирует только одно ядро.")
+            if config.get('seed') is None:
+                raise ValueError("Для пакетной симуляции каждой конфигурации нужно явное зерно (seed).")
+
+        batch_jobs = [_boot_jobs(config) for config in configs]
+        batch = len(configs)
+        slots = max(1, max(len(jobs) for jobs in batch_jobs))
+        longest = max([job.program_length for jobs in batch_jobs for job in jobs] or [1])
+
+        self.batch: int = batch
+        self.slots: int = slots
+        self.tick: int = 0
+        self.quantum = np.array([config.get('quantum_length', 5) for config in configs], dtype=np.int64)
+
+        # Программы дополняются кодом EXIT, поэтому выборка по pc не требует проверки длины
+        self.program = np.full((batch, slots, longest + 1), _EXIT, dtype=np.uint8)
+        self.length = np.zeros((batch, slots), dtype=np.int64)
+        self.io_duration = np.ones((batch, slots), dtype=np.int64)
+        self.state = np.full((batch, slots), EMPTY, dtype=np.int8)
+
+        self.queue = np.zeros((batch, slots), dtype=np.int64)
+        self.queue_head = np.zeros(batch, dtype=np.int64)
+        self.queue_size = np.zeros(batch, dtype=np.int64)
+
+        for b, jobs in enumerate(batch_jobs):
+            for slot, job in enumerate(jobs):
+                self.program[b, slot, :job.program_length] = np.frombuffer(job.program, dtype=np.uint8)
+                self.length[b, slot] = job.program_length
+                self.io_duration[b, slot] = max(job.io_duration, 1)
+                self.state[b, slot] = READY
+                self.queue[b, slot] = slot
+            self.queue_size[b] = len(jobs)
+
+        shape = (batch, slots)
+        self.pc = np.zeros(shape, dtype=np.int64)
+        self.ticks_in_quantum = np.zeros(shape, dtype=np.int64)
+        self.wakeup = np.full(shape, _NEVER, dtype=np.int64)
+        self.block_sequence = np.zeros(shape, dtype=np.int64)
+        self.arrival = np.ones(shape, dtype=np.int64)
+        self.state_since = np.ones(shape, dtype=np.int64)
+        self.first_run = np.full(shape, -1, dtype=np.int64)
+        self.completion = np.full(shape, -1, dtype=np.int64)
+        self.cpu_ticks = np.zeros(shape, dtype=np.int64)
+        self.io_wait = np.zeros(shape, dtype=np.int64)
+        self.ready_wait = np.zeros(shape, dtype=np.int64)
+
+        self.active = np.full(batch, -1, dtype=np.int64)
+        self.last_dispatched = np.full(batch, -1, dtype=np.int64)
+        self.sequence = np.zeros(batch, dtype=np.int64)
+        self.busy_ticks = np.zeros(batch, dtype=np.int64)
+        self.context_switches = np.zeros(batch, dtype=np.int64)
+        self._rows = np.arange(batch)
+
+    def _enqueue(self, rows, slots) -> None:
+        position = (self.queue_head[rows] + self.queue_size[rows]) % self.slots
+        self.queue[rows, position] = slots
+        self.queue_size[rows] += 1
+        self.state[rows, slots] = READY
+
+    def _wake_blocked(self, t: int) -> None:
+        due = (self.state == BLOCKED) & (self.wakeup <= t)
+        # За такт в одной симуляции может проснуться несколько процессов -
+        # ставим их в очередь по (такт пробуждения, порядок блокировки)
+        while due.any():
+            wakeup = np.where(due, self.wakeup, _NEVER)
+            candidates = due & (wakeup == wakeup.min(axis=1, keepdims=True))
+            slots = np.where(candidates, self.block_sequence, _NEVER).argmin(axis=1)
+            rows = np.nonzero(candidates[self._rows, slots])[0]
+            slots = slots[rows]
+
+            self.io_wait[rows, slots] += t - self.state_since[rows, slots]
+            self.state_since[rows, slots] = t
+            self.wakeup[rows, slots] = _NEVER
+            self._enqueue(rows, slots)
+            due[rows, slots] = False
+
+    def _dispatch(self, t: int) -> None:
+        rows = np.nonzero((self.active < 0) & (self.queue_size > 0))[0]
+        if rows.size == 0:
+            return
+
+        slots = self.queue[rows, self.queue_head[rows]]
+        self.queue_head[rows] = (self.queue_head[rows] + 1) % self.slots
+        self.queue_size[rows] -= 1
+
+        self.active[rows] = slots
+        self.state[rows, slots] = RUNNING
+        self.ticks_in_quantum[rows, slots] = 0
+        self.ready_wait[rows, slots] += t - self.state_since[rows, slots]
+        first = self.first_run[rows, slots] < 0
+        self.first_run[rows[first], slots[first]] = t
+
+        switched = self.last_dispatched[rows] != slots
+        self.context_switches[rows[switched]] += 1
+        self.last_dispatched[rows] = slots
+
+    def _execute(self, t: int) -> None:
+        rows = np.nonzero(self.active >= 0)[0]
+        if rows.size == 0:
+            return
+
+        slots = self.active[rows]
+        pc = self.pc[rows, slots]
+        code = self.program[rows, slots, np.minimum(pc, self.length[rows, slots])]
+        self.pc[rows, slots] = pc + 1
+        worked = self.ticks_in_quantum[rows, slots] + 1
+        self.ticks_in_quantum[rows, slots] = worked
+
+        io = code == _IO
+        exit_ = code == _EXIT
+        expired = (code == _COMPUTE) & (worked >= self.quantum[rows])
+        leaving = io | exit_ | expired
+        if not leaving.any():
+            return
+
+        stop_rows, stop_slots = rows[leaving], slots[leaving]
+        self.cpu_ticks[stop_rows, stop_slots] += worked[leaving]
+        self.busy_ticks[stop_rows] += worked[leaving]
+        self.active[stop_rows] = -1
+
+        if io.any():
+            r, s = rows[io], slots[io]
+            self.state[r, s] = BLOCKED
+            self.state_since[r, s] = t + 1
+            self.wakeup[r, s] = t + self.io_duration[r, s]
+            self.sequence[r] += 1
+            self.block_sequence[r, s] = self.sequence[r]
+
+        if exit_.any():
+            r, s = rows[exit_], slots[exit_]
+            self.state[r, s] = TERMINATED
+            self.completion[r, s] = t
+
+        if expired.any():
+            r, s = rows[expired], slots[expired]
+            self.state_since[r, s] = t + 1
+            self._enqueue(r, s)
+
+    def run(self, ticks: int) -> None:
+        end_tick = self.tick + ticks
+        while self.tick < end_tick:
+            if (self.active < 0).all() and not self.queue_size.any():
+                # Во всех симуляциях процессор простаивает - переходим к ближайшему пробуждению
+                blocked = self.state == BLOCKED
+                if not blocked.any():
+                    self.tick = end_tick
+                    break
+                idle_until = min(int(self.wakeup[blocked].min()) - 1, end_tick)
+                if idle_until > self.tick:
+                    self.tick = idle_until
+                    continue
+
+            self.tick += 1
+            t = self.tick
+            self._wake_blocked(t)
+            self._dispatch(t)
+            self._execute(t)
+
+    def summaries(self) -> List[Dict]:
+        results = []
+        tick = self.tick
+        for b in range(self.batch):
+            done = self.state[b] == TERMINATED
+            turnaround = self.completion[b][done] - self.arrival[b][done] + 1
+            response = self.first_run[b][done] - self.arrival[b][done]
+            completed = int(done.sum())
+            running = self.ticks_in_quantum[b, self.active[b]] if self.active[b] >= 0 else 0
+            busy_ticks = int(self.busy_ticks[b] + running)
+
+            results.append({
+                "completed": completed,
+                "cpu_utilisation": round(busy_ticks / tick, 4) if tick else 0.0,
+                "core_utilisation": [round(busy_ticks / tick, 4) if tick else 0.0],
+                "throughput_per_1000_ticks": round(completed * 1000 / tick, 3) if tick else 0.0,
+                "turnaround": _distribution(turnaround.tolist()),
+                "response": _distribution(response.tolist()),
+                "context_switches": int(self.context_switches[b]),
+                "migrations": 0,
+                # Все задачи загружаются при старте, без ожидания допуска и без подкачки
+                "admission_latency": _distribution([0] * int((self.state[b] != EMPTY).sum())),
+                "swap": {"out": 0, "in": 0, "bytes": 0},
+            })
+        return results
+
+
+def simulate_batch(configs: Sequence[Dict], ticks: int) -> List[Dict]:
+    simulation = BatchSimulation(configs)
+    simulation.run(ticks)
+    return simulation.summaries()
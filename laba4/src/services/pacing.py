@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Tuple
+
+# Дольше одного сна не ждём: изменение скорости и остановка применяются без задержки
+MAX_SLEEP = 0.1
+# Погрешность вещественных сроков: такт, срок которого наступил «почти», считается наступившим
+_EPSILON = 1e-9
+
+
+class Pacer:
+    # Такт n после привязки выполняется в момент origin + n / rate по монотонным часам.
+    # Время работы такта и пересып не накапливаются в ошибку: следующий срок не зависит от
+    # того, когда проснулись. Если интервал короче разрешения sleep, за одно пробуждение
+    # выдаётся пачка из нескольких наступивших тактов.
+    def __init__(self, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep,
+                 resolution: float = 0.001, max_batch: int = 64, window: float = 1.0):
+        if resolution <= 0 or max_batch < 1:
+            raise ValueError("Некорректные параметры темпа симуляции.")
+
+        self.clock = clock
+        self.sleep = sleep
+        self.resolution: float = resolution
+        self.max_batch: int = max_batch
+        self.window: float = window
+        self.rate: float = 0.0
+        self._origin: float = 0.0
+        self._issued: int = 0
+        self.ticks: int = 0
+        self.wakeups: int = 0
+        self.largest_batch: int = 0
+        self.dropped: int = 0
+        # (время, выдано тактов) за последнее окно - для фактической частоты
+        self._samples: Deque[Tuple[float, int]] = deque()
+
+    def _due(self, now: float) -> int:
+        return int((now - self._origin) * self.rate + _EPSILON) + 1 - self._issued
+
+    def take(self, rate: float) -> int:
+        # Без ожидания: число тактов, срок которых уже наступил (может быть 0)
+        if rate <= 0:
+            self.rate = rate
+            return 0
+
+        now = self.clock()
+        if rate != self.rate:
+            # Новая скорость отсчитывается от текущего момента
+            self.rate = rate
+            self._origin = now
+            self._issued = 0
+
+        due = self._due(now)
+        if due <= 0:
+            return 0
+        if due > self.max_batch:
+            # Система не успевает за заданной скоростью: отставание не навёрстывается, сроки сдвигаются
+            self.dropped += due - self.max_batch
+            self._issued += due - self.max_batch
+            due = self.max_batch
+
+        self._issued += due
+        self.ticks += due
+        self.wakeups += 1
+        self.largest_batch = max(self.largest_batch, due)
+
+        samples = self._samples
+        samples.append((now, self.ticks))
+        while len(samples) > 2 and now - samples[0][0] > self.window:
+            samples.popleft()
+        return due
+
+    def delay(self) -> float:
+        # Сколько ждать до срока следующего такта; короче разрешения sleep не ждём - такты копятся в пачку
+        if self.rate <= 0:
+            return MAX_SLEEP
+        remaining = self._origin + self._issued / self.rate - self.clock()
+        if remaining <= 0:
+            return 0.0
+        return min(max(remaining, self.resolution), MAX_SLEEP)
+
+    def wait(self, rate: float) -> int:
+        # Ждёт ближайшего срока и возвращает число тактов, которые нужно выполнить сейчас (может быть 0)
+        due = self.take(rate)
+        if due == 0:
+            self.sleep(self.delay())
+            due = self.take(rate)
+        return due
+
+    @property
+    def achieved_hz(self) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        (first_time, first_ticks), (last_time, last_ticks) = self._samples[0], self._samples[-1]
+        return (last_ticks - first_ticks) / (last_time - first_time) if last_time > first_time else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "target_hz": round(self.rate, 2),
+            "achieved_hz": round(self.achieved_hz, 2),
+            "wakeups": self.wakeups,
+            "ticks_per_wakeup": round(self.ticks / self.wakeups, 2) if self.wakeups else 0.0,
+            "largest_batch": self.largest_batch,
+            "dropped_ticks": self.dropped,
+        }
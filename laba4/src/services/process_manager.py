@@ -1,3 +1,4 @@
+from array import array
 from typing import Dict, Optional, List
 from ..core.process import Process
 
@@ -9,11 +10,14 @@ class ProcessManager:
     def is_table_full(self) -> bool:
         return len(self.process_table) >= self.max_processes
 
-    def create_and_register_process(self, size: int, program_length: int) -> Optional[Process]:
+    def create_and_register_process(self, size: int, program_length: int, priority: int = 0,
+                                    program: Optional[bytes] = None, pages: Optional[array] = None,
+                                    devices: Optional[bytes] = None) -> Optional[Process]:
         if self.is_table_full():
             return None
 
-        new_process = Process(size=size, program_length=program_length)
+        new_process = Process(size=size, program_length=program_length, priority=priority, program=program,
+                              pages=pages, devices=devices)
         self.process_table[new_process.pid] = new_process
         return new_process
 
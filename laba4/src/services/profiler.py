@@ -0,0 +1,111 @@
+import json
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Метод OperatingSystem -> фаза такта
+_OS_PHASES = {
+    "_tick": "tick",
+    "_handle_blocked_processes": "wake",
+    "_swap_in_ready": "swap_in",
+    "_admit_arrivals": "admission",
+    "_dispatch": "dispatch",
+    "_complete_instruction": "complete",
+    "_run_burst": "burst",
+    "publish_snapshot": "snapshot",
+}
+PHASES = tuple(_OS_PHASES.values()) + ("execute",)
+
+
+class TickProfiler:
+    # Фазы замеряются обёртками, которые ставятся поверх методов конкретных объектов
+    # (атрибут экземпляра перекрывает метод класса). Без профилировщика код такта
+    # не меняется вовсе; detach удаляет обёртки и возвращает методы класса.
+    def __init__(self, os_emulator, clock: Callable[[], float] = time.perf_counter):
+        self.os_emulator = os_emulator
+        self.clock = clock
+        self.total: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        # Время вложенных фаз: собственное время фазы = total - nested
+        self.nested: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.counters: Dict[str, int] = {"scheduler_add": 0, "scheduler_get": 0, "allocations": 0}
+        self.start_tick: int = os_emulator.tick_count
+        self.start_context_switches: int = os_emulator.metrics.context_switches
+        self._current: Optional[str] = None
+        self._installed: List[Tuple[object, str]] = []
+
+    def _timed(self, phase: str, method: Callable) -> Callable:
+        clock, total, nested, calls = self.clock, self.total, self.nested, self.calls
+
+        def wrapper(*args, **kwargs):
+            parent = self._current
+            self._current = phase
+            started = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                total[phase] += elapsed
+                calls[phase] += 1
+                if parent is not None:
+                    nested[parent] += elapsed
+                self._current = parent
+
+        return wrapper
+
+    def _counted(self, counter: str, method: Callable) -> Callable:
+        counters = self.counters
+
+        def wrapper(*args, **kwargs):
+            counters[counter] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    def _install(self, target: object, name: str, wrapper: Callable) -> None:
+        setattr(target, name, wrapper)
+        self._installed.append((target, name))
+
+    def attach(self) -> None:
+        if self._installed:
+            return
+
+        os_emulator = self.os_emulator
+        for name, phase in _OS_PHASES.items():
+            self._install(os_emulator, name, self._timed(phase, getattr(os_emulator, name)))
+        for core in os_emulator.cores:
+            self._install(core.cpu, "execute", self._timed("execute", core.cpu.execute))
+            self._install(core.scheduler, "add_process", self._counted("scheduler_add", core.scheduler.add_process))
+            self._install(core.scheduler, "get_next_process",
+                          self._counted("scheduler_get", core.scheduler.get_next_process))
+        memory_manager = os_emulator.memory_manager
+        self._install(memory_manager, "allocate", self._counted("allocations", memory_manager.allocate))
+
+    def detach(self) -> None:
+        for target, name in self._installed:
+            delattr(target, name)
+        self._installed.clear()
+
+    def report(self) -> Dict:
+        ticks = self.os_emulator.tick_count - self.start_tick
+        measured = self.total["tick"] + self.total["burst"] + self.total["snapshot"]
+        phases = {}
+        for phase in PHASES:
+            own = self.total[phase] - self.nested[phase]
+            phases[phase] = {
+                "calls": self.calls[phase],
+                "total_ms": round(self.total[phase] * 1e3, 3),
+                "self_ms": round(own * 1e3, 3),
+                "self_share": round(own / measured, 4) if measured else 0.0,
+            }
+        counters = dict(self.counters)
+        counters["context_switches"] = self.os_emulator.metrics.context_switches - self.start_context_switches
+        return {
+            "ticks": ticks,
+            "us_per_tick": round(measured * 1e6 / ticks, 3) if ticks else 0.0,
+            "phases": phases,
+            "counters": counters,
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
@@ -1,32 +1,326 @@
-from typing import List, Optional
-from collections import deque
+import heapq
+import sys
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from collections import OrderedDict
 from ..core.process import Process, ProcessState
 
+_SCHEDULABLE_STATES = frozenset({ProcessState.NEW, ProcessState.RUNNING, ProcessState.READY})
+
+
 class Scheduler:
-    def __init__(self):
-        self.ready_queue: deque[Process] = deque()
+    # Round-robin: базовая политика и общий интерфейс для остальных
+    name = "rr"
+    preemptive = False
+    # Может ли решение о вытеснении измениться от одного лишь хода времени
+    tick_preemption = False
+
+    def __init__(self, quantum_length: int = 5):
+        self.quantum_length: int = quantum_length
+        # pid -> процесс в порядке постановки в очередь (FIFO для round-robin)
+        self.ready_queue: OrderedDict[int, Process] = OrderedDict()
 
     def add_process(self, process: Process):
-        if process.state in [ProcessState.NEW, ProcessState.RUNNING, ProcessState.READY]:
+        if process.state in _SCHEDULABLE_STATES:
             process.state = ProcessState.READY
-            self.ready_queue.append(process)
+            self.ready_queue[process.pid] = process
 
     def get_next_process(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
 
-        return self.ready_queue.popleft()
+        return self.ready_queue.popitem(last=False)[1]
+
+    def peek(self) -> Optional[Process]:
+        if not self.ready_queue:
+            return None
+
+        return next(iter(self.ready_queue.values()))
 
     def remove_process(self, pid: int):
-        process_to_remove = None
-        for p in self.ready_queue:
-            if p.pid == pid:
-                process_to_remove = p
-                break
+        self.ready_queue.pop(pid, None)
+
+    def move_to_end(self, pid: int) -> bool:
+        if pid not in self.ready_queue:
+            return False
+
+        self.ready_queue.move_to_end(pid)
+        return True
+
+    def time_slice(self, process: Process) -> int:
+        return self.quantum_length
 
-        if process_to_remove:
-            self.ready_queue.remove(process_to_remove)
+    def account(self, process: Process, ticks: int, quantum_expired: bool) -> None:
+        pass
+
+    def should_preempt(self, process: Process) -> bool:
+        return False
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.ready_queue
+
+    def __len__(self) -> int:
+        return len(self.ready_queue)
 
     @property
     def has_ready_processes(self) -> bool:
-        return len(self.ready_queue) > 0
+        return len(self) > 0
+
+
+class _ProcessHeap:
+    # Min-куча с ленивым удалением: remove помечает запись, pop пропускает помеченные
+    def __init__(self):
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}
+        self._sequence: int = 0
+
+    def push(self, key, process: Process) -> None:
+        self.remove(process.pid)
+        self._sequence += 1
+        entry = [key, self._sequence, process]
+        self._entries[process.pid] = entry
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> Optional[Process]:
+        heap = self._heap
+        while heap:
+            process = heapq.heappop(heap)[2]
+            if process is not None:
+                del self._entries[process.pid]
+                return process
+        return None
+
+    def peek_entry(self) -> Optional[list]:
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def remove(self, pid: int) -> None:
+        entry = self._entries.pop(pid, None)
+        if entry is not None:
+            entry[2] = None
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _HeapScheduler(Scheduler, ABC):
+    # Очередь готовых - куча; порядок задаёт ключ конкретной политики
+    def __init__(self, quantum_length: int = 5):
+        super().__init__(quantum_length)
+        self.ready_queue = _ProcessHeap()
+
+    @abstractmethod
+    def _key(self, process: Process):
+        pass
+
+    def add_process(self, process: Process):
+        if process.state in _SCHEDULABLE_STATES:
+            process.state = ProcessState.READY
+            self.ready_queue.push(self._key(process), process)
+
+    def get_next_process(self) -> Optional[Process]:
+        return self.ready_queue.pop()
+
+    def peek(self) -> Optional[Process]:
+        entry = self.ready_queue.peek_entry()
+        return entry[2] if entry else None
+
+    def remove_process(self, pid: int):
+        self.ready_queue.remove(pid)
+
+    def move_to_end(self, pid: int) -> bool:
+        return False
+
+
+class SRTFScheduler(_HeapScheduler):
+    # Shortest Remaining Time First: куча по оставшейся длине программы
+    name = "srtf"
+    preemptive = True
+
+    def _key(self, process: Process):
+        return process.program_length - process.program_counter
+
+    def time_slice(self, process: Process) -> int:
+        return sys.maxsize
+
+    def should_preempt(self, process: Process) -> bool:
+        entry = self.ready_queue.peek_entry()
+        return entry is not None and entry[0] < self._key(process)
+
+
+class PriorityScheduler(_HeapScheduler):
+    # Меньшее значение priority - более высокий приоритет; равные чередуются по кванту
+    name = "priority"
+    preemptive = True
+
+    def _key(self, process: Process):
+        return process.priority
+
+    def should_preempt(self, process: Process) -> bool:
+        entry = self.ready_queue.peek_entry()
+        return entry is not None and entry[0] < process.priority
+
+
+class CFSScheduler(_HeapScheduler):
+    # Completely Fair Scheduler: куча по виртуальному времени выполнения
+    name = "cfs"
+    preemptive = True
+    tick_preemption = True
+    NICE_0_WEIGHT = 1024
+
+    def __init__(self, quantum_length: int = 5, target_latency: int = 20, min_granularity: int = 1):
+        super().__init__(quantum_length)
+        self.target_latency: int = target_latency
+        self.min_granularity: int = min_granularity
+        self.min_vruntime: float = 0.0
+
+    def _weight(self, process: Process) -> float:
+        return self.NICE_0_WEIGHT / (1.25 ** process.priority)
+
+    def _key(self, process: Process):
+        return process.vruntime
+
+    def add_process(self, process: Process):
+        if process.state in _SCHEDULABLE_STATES:
+            # Новые и проснувшиеся процессы не получают накопленного "долга" по времени
+            process.vruntime = max(process.vruntime, self.min_vruntime - self.target_latency)
+        super().add_process(process)
+
+    def get_next_process(self) -> Optional[Process]:
+        process = self.ready_queue.pop()
+        if process is not None:
+            self.min_vruntime = max(self.min_vruntime, process.vruntime)
+        return process
+
+    def time_slice(self, process: Process) -> int:
+        return max(self.min_granularity, self.target_latency // (len(self.ready_queue) + 1))
+
+    def account(self, process: Process, ticks: int, quantum_expired: bool) -> None:
+        process.vruntime += ticks * self.NICE_0_WEIGHT / self._weight(process)
+
+    def should_preempt(self, process: Process) -> bool:
+        entry = self.ready_queue.peek_entry()
+        if entry is None:
+            return False
+        current = process.vruntime + process.ticks_worked_in_quantum * self.NICE_0_WEIGHT / self._weight(process)
+        return entry[0] + self.min_granularity < current
+
+
+class MLFQScheduler(Scheduler):
+    # Многоуровневая очередь с обратной связью: уровень i получает квант quantum * 2^i
+    name = "mlfq"
+    preemptive = True
+
+    def __init__(self, quantum_length: int = 5, levels: int = 3, boost_interval: int = 200):
+        super().__init__(quantum_length)
+        self.levels: List[OrderedDict[int, Process]] = [OrderedDict() for _ in range(levels)]
+        self.boost_interval: int = boost_interval
+        self._ticks_since_boost: int = 0
+        self._count: int = 0
+
+    def add_process(self, process: Process):
+        if process.state in _SCHEDULABLE_STATES:
+            process.state = ProcessState.READY
+            queue = self.levels[process.queue_level]
+            if process.pid not in queue:
+                self._count += 1
+            queue[process.pid] = process
+
+    def _top_level(self) -> Optional[int]:
+        if self._count == 0:
+            return None
+        for level, queue in enumerate(self.levels):
+            if queue:
+                return level
+        return None
+
+    def get_next_process(self) -> Optional[Process]:
+        level = self._top_level()
+        if level is None:
+            return None
+
+        self._count -= 1
+        return self.levels[level].popitem(last=False)[1]
+
+    def peek(self) -> Optional[Process]:
+        level = self._top_level()
+        if level is None:
+            return None
+
+        return next(iter(self.levels[level].values()))
+
+    def remove_process(self, pid: int):
+        for queue in self.levels:
+            if queue.pop(pid, None) is not None:
+                self._count -= 1
+                return
+
+    def move_to_end(self, pid: int) -> bool:
+        for queue in self.levels:
+            if pid in queue:
+                queue.move_to_end(pid)
+                return True
+        return False
+
+    def time_slice(self, process: Process) -> int:
+        return self.quantum_length << process.queue_level
+
+    def account(self, process: Process, ticks: int, quantum_expired: bool) -> None:
+        if quantum_expired and process.queue_level < len(self.levels) - 1:
+            process.queue_level += 1
+
+        self._ticks_since_boost += ticks
+        if self.boost_interval and self._ticks_since_boost >= self.boost_interval:
+            self._boost()
+
+    def _boost(self) -> None:
+        # Периодический подъём всех ожидающих процессов на верхний уровень против голодания
+        self._ticks_since_boost = 0
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            while queue:
+                pid, process = queue.popitem(last=False)
+                process.queue_level = 0
+                top[pid] = process
+
+    def should_preempt(self, process: Process) -> bool:
+        level = self._top_level()
+        return level is not None and level < process.queue_level
+
+    def __contains__(self, pid: int) -> bool:
+        return any(pid in queue for queue in self.levels)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+SCHEDULERS = {
+    Scheduler.name: Scheduler,
+    MLFQScheduler.name: MLFQScheduler,
+    SRTFScheduler.name: SRTFScheduler,
+    PriorityScheduler.name: PriorityScheduler,
+    CFSScheduler.name: CFSScheduler,
+}
+
+
+def create_scheduler(config: Dict) -> Scheduler:
+    name = config.get('scheduler', Scheduler.name)
+    quantum_length = config.get('quantum_length', 5)
+
+    if name not in SCHEDULERS:
+        raise ValueError(f"Неизвестная политика планирования: {name}. Доступны: {', '.join(SCHEDULERS)}")
+
+    if name == MLFQScheduler.name:
+        return MLFQScheduler(quantum_length,
+                             levels=config.get('mlfq_levels', 3),
+                             boost_interval=config.get('mlfq_boost_interval', 200))
+    if name == CFSScheduler.name:
+        return CFSScheduler(quantum_length,
+                            target_latency=config.get('cfs_target_latency', 20),
+                            min_granularity=config.get('cfs_min_granularity', 1))
+    return SCHEDULERS[name](quantum_length)
@@ -0,0 +1,78 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from ..core.process import Process
+
+
+class ProcessRow(NamedTuple):
+    pid: int
+    state: str
+    program_counter: int
+    ticks_worked_in_quantum: int
+    io_time_remaining: int
+    size: int
+    priority: int
+    last_core: int
+
+
+class SystemSnapshot(NamedTuple):
+    version: int
+    tick: int
+    stats: Mapping
+    processes: Tuple[ProcessRow, ...]
+    next_task: Optional[ProcessRow]
+
+
+def _row(process: Process, io_remaining: Mapping[int, int]) -> ProcessRow:
+    return ProcessRow(process.pid, process.state.value, process.program_counter, process.ticks_worked_in_quantum,
+                      io_remaining.get(process.pid, process.io_time_remaining), process.size, process.priority,
+                      process.last_core)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class SnapshotPublisher:
+    # Поток симуляции собирает неизменяемый снимок в заднем буфере и переключает индекс;
+    # читатели берут текущий снимок без блокировок - присваивание ссылки атомарно.
+    # Снимок строится не чаще раза в interval тактов и раза в period секунд: интерфейс
+    # обновляется по таймеру, и сборка снимка на каждом такте замедлила бы симуляцию
+    def __init__(self, interval: int = 1, period: float = 0.1):
+        self.interval: int = max(1, interval)
+        self.period: float = max(0.0, period)
+        self.version: int = 0
+        self._buffers: List[Optional[SystemSnapshot]] = [None, None]
+        self._front: int = 0
+        self._last_tick: Optional[int] = None
+        self._last_time: float = 0.0
+
+    def due(self, tick: int, now: float) -> bool:
+        if self._last_tick is None:
+            return True
+        return tick - self._last_tick >= self.interval and now - self._last_time >= self.period
+
+    def publish(self, tick: int, now: float, stats: Dict, processes: Iterable[Process],
+                next_task: Optional[Process], io_remaining: Mapping[int, int]) -> SystemSnapshot:
+        self.version += 1
+        snapshot = SystemSnapshot(
+            version=self.version,
+            tick=tick,
+            stats=_freeze(stats),
+            processes=tuple(sorted((_row(process, io_remaining) for process in processes), key=lambda row: row.pid)),
+            next_task=_row(next_task, io_remaining) if next_task is not None else None,
+        )
+
+        back = 1 - self._front
+        self._buffers[back] = snapshot
+        self._front = back
+        self._last_tick = tick
+        self._last_time = now
+        return snapshot
+
+    def latest(self) -> Optional[SystemSnapshot]:
+        return self._buffers[self._front]
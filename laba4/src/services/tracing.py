@@ -0,0 +1,169 @@
+import mmap
+import queue
+import struct
+import threading
+from enum import IntEnum
+from typing import Iterator, List, Tuple
+
+from ..core.process import ProcessState
+
+TRACE_MAGIC = b"OSTR"
+TRACE_VERSION = 1
+# Заголовок: сигнатура, версия, размер записи, число ядер, последний такт (дописывается при закрытии)
+HEADER = struct.Struct("<4sHHHxxQ")
+# Запись: такт, pid, состояние до, состояние после, событие, ядро
+RECORD = struct.Struct("<QIBBBB")
+RECORD_SIZE = RECORD.size
+_pack_into = RECORD.pack_into
+NO_CORE = 255
+
+STATES: List[ProcessState] = list(ProcessState)
+# Enum.__hash__ выполняется интерпретатором, а члены перечисления - единственные экземпляры,
+# поэтому код состояния ищется по id: запись не должна заметно замедлять такт
+_STATE_CODES = {id(state): code for code, state in enumerate(STATES)}
+
+
+class TraceEvent(IntEnum):
+    ARRIVE = 0
+    ADMIT = 1
+    DISPATCH = 2
+    PREEMPT = 3
+    QUANTUM = 4
+    IO = 5
+    PAGE_FAULT = 6
+    WAKE = 7
+    EXIT = 8
+    SWAP_OUT = 9
+    SWAP_IN = 10
+
+
+# События, которыми заканчивается отрезок выполнения на ядре
+STOP_EVENTS = frozenset({TraceEvent.PREEMPT, TraceEvent.QUANTUM, TraceEvent.IO,
+                         TraceEvent.PAGE_FAULT, TraceEvent.EXIT})
+
+
+class TraceWriter:
+    # Записи упаковываются в заранее выделенные буферы без создания объектов;
+    # заполненный буфер уходит фоновому потоку записи, а симуляция продолжает в следующем
+    # свободном буфере по кругу. Ждать приходится, только если запись отстала на все буферы.
+    def __init__(self, path: str, cpu_count: int = 1, capacity: int = 65536, buffers: int = 4):
+        if capacity < 1 or buffers < 2:
+            raise ValueError("Трасса: нужно не меньше двух буферов ненулевого размера.")
+
+        self.path: str = path
+        self.cpu_count: int = cpu_count
+        self.stalls: int = 0
+        self._flushed: int = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD_SIZE, cpu_count, 0))
+
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(buffers):
+            self._free.put(bytearray(capacity * RECORD_SIZE))
+        self._full: queue.Queue = queue.Queue()
+        self._buffer: bytearray = self._free.get()
+        self._offset: int = 0
+        self._limit: int = capacity * RECORD_SIZE
+
+        self._thread = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, tick: int, pid: int, from_state: ProcessState, to_state: ProcessState,
+               event: TraceEvent, core: int = NO_CORE) -> None:
+        offset = self._offset
+        _pack_into(self._buffer, offset, tick, pid, _STATE_CODES[id(from_state)], _STATE_CODES[id(to_state)],
+                   event, core)
+        offset += RECORD_SIZE
+        if offset == self._limit:
+            self._hand_off(offset)
+        else:
+            self._offset = offset
+
+    @property
+    def records(self) -> int:
+        return self._flushed + self._offset // RECORD_SIZE
+
+    def _hand_off(self, length: int) -> None:
+        self._flushed += length // RECORD_SIZE
+        self._full.put((self._buffer, length))
+        try:
+            self._buffer = self._free.get_nowait()
+        except queue.Empty:
+            self.stalls += 1
+            self._buffer = self._free.get()
+        self._offset = 0
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._full.get()
+            if item is None:
+                return
+            buffer, length = item
+            self._file.write(memoryview(buffer)[:length])
+            self._free.put(buffer)
+
+    def stats(self) -> dict:
+        return {"path": self.path, "records": self.records, "stalls": self.stalls}
+
+    def close(self, end_tick: int) -> None:
+        if self._file.closed:
+            return
+
+        if self._offset:
+            self._hand_off(self._offset)
+        self._full.put(None)
+        self._thread.join()
+
+        self._file.seek(0)
+        self._file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD_SIZE, self.cpu_count, end_tick))
+        self._file.close()
+
+
+class TraceReader:
+    # Файл отображается в память: записи распаковываются по одной прямо из отображения,
+    # в памяти не держится ничего, кроме текущей записи
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл трассы пуст: {path}")
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Файл не является трассой эмулятора: {path}")
+        magic, version, record_size, cpu_count, end_tick = HEADER.unpack_from(self._map, 0)
+        if magic != TRACE_MAGIC or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"Файл не является трассой эмулятора: {path}")
+        if version != TRACE_VERSION:
+            self.close()
+            raise ValueError(f"Неподдерживаемая версия трассы: {version}")
+
+        self.cpu_count: int = cpu_count
+        # 0 - запись не была закрыта штатно; последняя неполная запись отбрасывается
+        self.end_tick: int = end_tick
+        self.count: int = (len(self._map) - HEADER.size) // RECORD_SIZE
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int, int, int, int]]:
+        view = memoryview(self._map)[HEADER.size:HEADER.size + self.count * RECORD_SIZE]
+        records = RECORD.iter_unpack(view)
+        try:
+            yield from records
+        finally:
+            del records
+            view.release()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
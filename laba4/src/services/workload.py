@@ -0,0 +1,242 @@
+import math
+from array import array
+import random
+import struct
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from ..core.command import CommandType
+
+TRACE_MAGIC = b"OSWL"
+TRACE_VERSION = 3
+# Заголовок: сигнатура, версия, зерно, число задач, локальность обращений к страницам
+_TRACE_HEADER = struct.Struct("<4sHQId")
+_TRACE_RECORD = struct.Struct("<IIIIh")
+
+ARRIVAL_PROCESSES = ("boot", "fixed", "poisson", "bursty")
+
+
+class Job(NamedTuple):
+    arrival_tick: int
+    size: int
+    program_length: int
+    io_duration: int
+    priority: int
+    program: bytes
+
+
+class Distribution:
+    # Спецификация: число (константа) или {"dist": "const"|"uniform"|"exp"|"normal", ...}
+    def __init__(self, spec: Union[int, float, Dict], minimum: int = 0):
+        if isinstance(spec, (int, float)):
+            spec = {"dist": "const", "value": spec}
+
+        self.kind: str = spec.get("dist", "const")
+        self.spec: Dict = spec
+        self.minimum: int = minimum
+
+        if self.kind not in ("const", "uniform", "exp", "normal"):
+            raise ValueError(f"Неизвестное распределение: {self.kind}")
+
+    def sample(self, rng: random.Random) -> int:
+        spec = self.spec
+        if self.kind == "const":
+            value = spec["value"]
+        elif self.kind == "uniform":
+            value = rng.randint(spec["min"], spec["max"])
+        elif self.kind == "exp":
+            value = round(rng.expovariate(1.0 / spec["mean"]))
+        else:
+            value = round(rng.gauss(spec["mean"], spec["std"]))
+
+        return max(self.minimum, int(value))
+
+
+class Workload:
+    def __init__(self, config: Dict, seed: int, record: bool = False):
+        spec = config.get('workload', {})
+        arrival = spec.get('arrival', {"process": "boot"})
+
+        self.seed: int = seed
+        self.rng = random.Random(f"{seed}:workload")
+        self.arrival_process: str = arrival.get("process", "boot")
+        self.arrival: Dict = arrival
+
+        if self.arrival_process not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Неизвестный процесс поступления задач: {self.arrival_process}")
+
+        self.size = Distribution(spec.get('size', config.get('default_process_size', 128)), minimum=1)
+        self.program_length = Distribution(spec.get('program_length', config.get('program_length', 30)), minimum=1)
+        self.io_duration = Distribution(spec.get('io_duration', config.get('io_duration', 15)), minimum=1)
+        self.priority = Distribution(spec.get('priority', 0), minimum=-20)
+
+        self._burst_size = Distribution(arrival.get("burst_size", 5), minimum=1)
+
+        io_probability = config.get('io_command_probability', 0.2)
+        mix = spec.get('instruction_mix', {"COMPUTE": 1.0 - io_probability, "IO": io_probability})
+        self.instruction_codes: List[int] = []
+        self.instruction_weights: List[float] = []
+        for name, weight in mix.items():
+            command_type = CommandType[name.upper()]
+            if command_type == CommandType.EXIT:
+                raise ValueError("EXIT не может входить в набор команд: процесс завершается по концу программы.")
+            if command_type == CommandType.PAGE_FAULT:
+                raise ValueError("PAGE_FAULT не может входить в набор команд: это сигнал процессора.")
+            self.instruction_codes.append(command_type.value)
+            self.instruction_weights.append(weight)
+
+        # Обращения к страницам генерируются отдельным потоком случайных чисел,
+        # чтобы включение страничной памяти не меняло саму нагрузку
+        self.page_rng = random.Random(f"{seed}:pages")
+        self.locality: float = spec.get('locality', 0.9)
+        self.device_rng = random.Random(f"{seed}:devices")
+
+        self.history: Optional[List[Job]] = [] if record else None
+        # Состояние потока поступлений хранится в полях, а не в генераторе - его можно сохранить в контрольной точке
+        self._produced: int = 0
+        self._burst_left: int = 0
+        self._tick: int = 0
+        self._time: float = 0.0
+        self._next_arrival: Optional[int] = self._advance_arrival()
+
+    @property
+    def boot_only(self) -> bool:
+        return self.arrival_process == "boot"
+
+    @property
+    def next_arrival_tick(self) -> Optional[int]:
+        return None if self.boot_only else self._next_arrival
+
+    def _advance_arrival(self) -> Optional[int]:
+        rng = self.rng
+        arrival = self.arrival
+        limit = arrival.get("limit")
+
+        # Ограничение проверяется перед очередной пачкой: пачка выдаётся целиком
+        while not self._burst_left:
+            if limit is not None and self._produced >= limit:
+                return None
+
+            if self.arrival_process == "boot":
+                count = 1
+            elif self.arrival_process == "fixed":
+                self._tick += arrival.get("interval", 10)
+                count = arrival.get("count", 1)
+            elif self.arrival_process == "poisson":
+                self._time += rng.expovariate(arrival.get("rate", 0.05))
+                self._tick = math.ceil(self._time)
+                count = 1
+            else:
+                # Пачки задач, сами пачки поступают по Пуассону
+                self._time += rng.expovariate(arrival.get("rate", 0.01))
+                self._tick = math.ceil(self._time)
+                count = self._burst_size.sample(rng)
+            self._burst_left = count
+
+        self._burst_left -= 1
+        self._produced += 1
+        return self._tick
+
+    def next_job(self) -> Optional[Job]:
+        arrival_tick = self._next_arrival
+        if arrival_tick is None:
+            return None
+
+        rng = self.rng
+        program_length = self.program_length.sample(rng)
+        job = Job(
+            arrival_tick=arrival_tick,
+            size=self.size.sample(rng),
+            program_length=program_length,
+            io_duration=self.io_duration.sample(rng),
+            priority=self.priority.sample(rng),
+            program=self.compile_program(program_length),
+        )
+        self._next_arrival = self._advance_arrival()
+
+        if self.history is not None:
+            self.history.append(job)
+        return job
+
+    def compile_program(self, length: int) -> bytes:
+        # Вся программа генерируется разом, а не по одной команде на такт
+        return bytes(self.rng.choices(self.instruction_codes, self.instruction_weights, k=length))
+
+    def compile_devices(self, program: bytes, weights: List[float]) -> bytes:
+        # Для каждой команды ввода-вывода - номер устройства, к которому она обращается
+        rng = self.device_rng
+        devices = range(len(weights))
+        io_code = CommandType.IO.value
+        return bytes(rng.choices(devices, weights)[0] if code == io_code else 0 for code in program)
+
+    def compile_pages(self, page_count: int, length: int) -> array:
+        # С вероятностью locality команда обращается к той же странице, что и предыдущая,
+        # иначе - к случайной странице процесса
+        rng = self.page_rng
+        locality = self.locality
+        pages = array('I')
+        page = 0
+        for _ in range(length):
+            if rng.random() >= locality:
+                page = rng.randrange(page_count)
+            pages.append(page)
+        return pages
+
+    def save_trace(self, path: str) -> int:
+        if self.history is None:
+            raise ValueError("Запись нагрузки не была включена.")
+
+        write_trace(path, self.seed, self.arrival_process, self.locality, self.history)
+        return len(self.history)
+
+
+class ReplayWorkload(Workload):
+    # Воспроизведение записанной нагрузки: те же задачи, то же зерно симуляции
+    # и та же локальность обращений к страницам. Набор команд для процессов,
+    # созданных вручную во время воспроизведения, берётся из конфигурации
+    def __init__(self, path: str, config: Dict, record: bool = False):
+        seed, arrival_process, locality, jobs = read_trace(path)
+        super().__init__(config, seed, record)
+        # Поток поступлений из конфигурации не используется; генератор команд начинается с зерна трассы
+        self.rng = random.Random(f"{seed}:workload")
+        self.arrival_process = arrival_process
+        self.arrival = {"process": arrival_process}
+        self.locality = locality
+        self._jobs: List[Job] = jobs
+        self._position: int = 0
+        self._next_arrival = jobs[0].arrival_tick if jobs else None
+
+    def next_job(self) -> Optional[Job]:
+        if self._position >= len(self._jobs):
+            return None
+
+        job = self._jobs[self._position]
+        self._position += 1
+        self._next_arrival = self._jobs[self._position].arrival_tick if self._position < len(self._jobs) else None
+
+        if self.history is not None:
+            self.history.append(job)
+        return job
+
+
+def write_trace(path: str, seed: int, arrival_process: str, locality: float, jobs: List[Job]) -> None:
+    with open(path, "wb") as f:
+        f.write(_TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, seed, len(jobs), locality))
+        f.write(arrival_process.encode().ljust(8, b"\0"))
+        for job in jobs:
+            f.write(_TRACE_RECORD.pack(*job[:-1]))
+            f.write(job.program)
+
+
+def read_trace(path: str) -> tuple[int, str, float, List[Job]]:
+    with open(path, "rb") as f:
+        magic, version, seed, count, locality = _TRACE_HEADER.unpack(f.read(_TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError(f"Файл {path} не является трассой нагрузки версии {TRACE_VERSION}.")
+
+        arrival_process = f.read(8).rstrip(b"\0").decode()
+        jobs = []
+        for _ in range(count):
+            fields = _TRACE_RECORD.unpack(f.read(_TRACE_RECORD.size))
+            jobs.append(Job(*fields, program=f.read(fields[2])))
+
+    return seed, arrival_process, locality, jobs
@@ -0,0 +1,148 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Set
+
+from .os import OperatingSystem
+
+_METRIC_COLUMNS = [
+    "completed", "cpu_utilisation", "throughput_per_1000_ticks",
+    "turnaround_mean", "turnaround_p50", "turnaround_p95", "turnaround_p99",
+    "response_mean", "response_p50", "response_p95", "response_p99",
+    "context_switches", "tick", "elapsed_s",
+]
+
+
+def _flatten_metrics(metrics: Dict) -> Dict:
+    row = {}
+    for name, value in metrics.items():
+        if isinstance(value, dict):
+            for stat, stat_value in value.items():
+                row[f"{name}_{stat}"] = stat_value
+        else:
+            row[name] = value
+    return row
+
+
+def _run_key(params: Dict, repeat: int) -> str:
+    return json.dumps(params, sort_keys=True) + f"#{repeat}"
+
+
+def expand_grid(spec: Dict, base_config: Dict) -> List[Dict]:
+    grid = spec.get("grid", {})
+    names = sorted(grid)
+    base_seed = spec.get("seed", 0)
+    tasks = []
+
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        for repeat in range(spec.get("repeats", 1)):
+            key = _run_key(params, repeat)
+            # Зерно зависит только от параметров и номера повтора - продолжение не меняет результатов
+            seed = random.Random(f"{base_seed}:{key}").getrandbits(32)
+            config = dict(base_config, **params, seed=seed)
+            tasks.append({"key": key, "params": params, "repeat": repeat, "seed": seed, "config": config})
+    return tasks
+
+
+def run_chunk(chunk: List[Dict], ticks: int, engine: str) -> List[Dict]:
+    started = time.perf_counter()
+    if engine == "numpy":
+        from .services.numpy_backend import simulate_batch
+        summaries = simulate_batch([task["config"] for task in chunk], ticks)
+        elapsed = (time.perf_counter() - started) / len(chunk)
+        results = [dict(_flatten_metrics(summary), tick=ticks, elapsed_s=round(elapsed, 4)) for summary in summaries]
+    else:
+        results = []
+        for task in chunk:
+            started = time.perf_counter()
+            stats = OperatingSystem(task["config"]).run_for(ticks, event_driven=engine == "event")
+            elapsed = time.perf_counter() - started
+            results.append(dict(_flatten_metrics(stats["metrics"]), tick=stats["tick"], elapsed_s=round(elapsed, 4)))
+
+    rows = []
+    for task, metrics in zip(chunk, results):
+        row = {"run_key": task["key"], "repeat": task["repeat"], "seed": task["seed"]}
+        row.update(task["params"])
+        row.update(metrics)
+        rows.append(row)
+    return rows
+
+
+def _completed_keys(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+
+    with open(path, newline="") as f:
+        return {row["run_key"] for row in csv.DictReader(f)}
+
+
+def _chunks(tasks: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for start in range(0, len(tasks), size):
+        yield tasks[start:start + size]
+
+
+def run_sweep(spec: Dict, base_config: Dict, output_path: str, workers: int, chunk_size: int = 0) -> int:
+    ticks = spec.get("ticks", 10000)
+    engine = spec.get("engine", "event")
+    tasks = expand_grid(spec, base_config)
+
+    done = _completed_keys(output_path)
+    tasks = [task for task in tasks if task["key"] not in done]
+    if not tasks:
+        return 0
+
+    if chunk_size <= 0:
+        # Несколько порций на процесс: баланс нагрузки без лишних затрат на pickle
+        chunk_size = max(1, len(tasks) // (workers * 4))
+
+    param_columns = sorted(spec.get("grid", {}))
+    columns = ["run_key", "repeat", "seed"] + param_columns + _METRIC_COLUMNS
+    write_header = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+
+    completed = 0
+    with open(output_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(_chunks(tasks, chunk_size))
+            for rows in executor.map(run_chunk, chunks, itertools.repeat(ticks), itertools.repeat(engine)):
+                writer.writerows(rows)
+                f.flush()
+                completed += len(rows)
+                print(f"Готово {completed}/{len(tasks)}")
+
+    return completed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Параллельный перебор параметров эмулятора")
+    parser.add_argument("grid", help="JSON с описанием сетки параметров.")
+    parser.add_argument("--config", default="config.json", help="Базовая конфигурация.")
+    parser.add_argument("--out", default="sweep_results.csv", help="CSV-файл с результатами (дописывается).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=0, help="Конфигураций на одну задачу пула (0 - авто).")
+    args = parser.parse_args()
+
+    with open(args.grid) as f:
+        spec = json.load(f)
+    # Как и main.py, конфигурация ищется относительно каталога laba4, а не текущего каталога
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(base_dir, args.config)) as f:
+        base_config = json.load(f)
+    base_config.update(spec.get("base", {}))
+
+    started = time.perf_counter()
+    completed = run_sweep(spec, base_config, args.out, args.workers, args.chunk_size)
+    print(f"Выполнено запусков: {completed} за {time.perf_counter() - started:.1f} с -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
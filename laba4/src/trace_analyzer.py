@@ -0,0 +1,160 @@
+import argparse
+import csv
+import json
+from array import array
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .services.metrics import _distribution
+from .services.tracing import STATES, STOP_EVENTS, TraceEvent, TraceReader
+
+_SYMBOLS = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+Segment = Callable[[int, int, int, int], None]
+
+
+class GanttChart:
+    # Окно [start, end) делится на width столбцов; хранится только по строке на ядро
+    def __init__(self, cpu_count: int, start: int, end: int, width: int = 100):
+        if end <= start:
+            raise ValueError("Пустое окно диаграммы Ганта.")
+
+        self.start: int = start
+        self.end: int = end
+        self.width: int = max(1, min(width, end - start))
+        self.scale: float = (end - start) / self.width
+        self.rows: List[List[str]] = [["."] * self.width for _ in range(cpu_count)]
+
+    def add(self, core: int, pid: int, start: int, end: int) -> None:
+        start, end = max(start, self.start), min(end, self.end)
+        if start >= end:
+            return
+
+        first = int((start - self.start) / self.scale)
+        last = max(first, int((end - self.start) / self.scale - 1e-9))
+        symbol = _SYMBOLS[pid % len(_SYMBOLS)]
+        row = self.rows[core]
+        for column in range(first, min(last, self.width - 1) + 1):
+            row[column] = symbol
+
+    def render(self) -> List[str]:
+        lines = [f"Такты {self.start}..{self.end - 1}, столбец = {self.scale:g} такт., символ = pid % {len(_SYMBOLS)}"]
+        for core, row in enumerate(self.rows):
+            lines.append(f"CPU{core:<3}|{''.join(row)}|")
+        return lines
+
+
+def analyze(reader: TraceReader, on_segment: Optional[Segment] = None) -> Dict:
+    # Один проход по трассе; в памяти - только процессы, ещё не завершившиеся к текущей записи
+    cpu_count = max(1, reader.cpu_count)
+    arrivals: Dict[int, int] = {}
+    first_runs: Dict[int, int] = {}
+    running: Dict[int, Tuple[int, int]] = {}
+    state_since: Dict[int, int] = {}
+    state_ticks = [0] * len(STATES)
+    core_busy = [0] * cpu_count
+    last_pid: List[Optional[int]] = [None] * cpu_count
+    turnaround = array('q')
+    response = array('q')
+    events: Counter = Counter()
+    context_switches = 0
+    last_tick = 0
+
+    for tick, pid, from_state, to_state, event, core in reader:
+        events[event] += 1
+        last_tick = max(last_tick, tick)
+
+        since = state_since.get(pid)
+        if since is not None:
+            state_ticks[from_state] += tick - since
+        state_since[pid] = tick
+
+        if event == TraceEvent.ARRIVE:
+            arrivals[pid] = tick
+        elif event == TraceEvent.DISPATCH:
+            running[pid] = (tick, core)
+            first_runs.setdefault(pid, tick)
+            if last_pid[core] != pid:
+                context_switches += 1
+                last_pid[core] = pid
+        elif event in STOP_EVENTS:
+            start, _ = running.pop(pid)
+            core_busy[core] += tick - start
+            if on_segment is not None:
+                on_segment(core, pid, start, tick)
+
+        if event == TraceEvent.EXIT:
+            arrival = arrivals.pop(pid)
+            turnaround.append(tick - arrival)
+            response.append(first_runs.pop(pid) - arrival)
+            del state_since[pid]
+
+    end_tick = reader.end_tick or last_tick
+    # Незавершённые к концу трассы отрезки выполнения
+    for pid, (start, core) in running.items():
+        if on_segment is not None:
+            on_segment(core, pid, start, end_tick + 1)
+        core_busy[core] += end_tick + 1 - start
+
+    completed = len(turnaround)
+    return {
+        "records": len(reader),
+        "end_tick": end_tick,
+        "completed": completed,
+        "cpu_utilisation": round(sum(core_busy) / (end_tick * cpu_count), 4) if end_tick else 0.0,
+        "core_utilisation": [round(busy / end_tick, 4) if end_tick else 0.0 for busy in core_busy],
+        "throughput_per_1000_ticks": round(completed * 1000 / end_tick, 3) if end_tick else 0.0,
+        "turnaround": _distribution(turnaround),
+        "response": _distribution(response),
+        "context_switches": context_switches,
+        "events": {TraceEvent(event).name.lower(): count for event, count in sorted(events.items())},
+        "state_ticks": {STATES[code].value: ticks for code, ticks in enumerate(state_ticks) if ticks},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Анализ двоичной трассы эмулятора")
+    parser.add_argument("trace", help="Файл трассы (--trace эмулятора).")
+    parser.add_argument("--gantt", action="store_true", help="Вывести диаграмму Ганта.")
+    parser.add_argument("--from", dest="start", type=int, default=1, help="Первый такт диаграммы.")
+    parser.add_argument("--to", dest="end", type=int, help="Последний такт диаграммы (по умолчанию - конец трассы).")
+    parser.add_argument("--width", type=int, default=100, help="Ширина диаграммы в символах.")
+    parser.add_argument("--segments", metavar="PATH", help="Записать отрезки выполнения в CSV.")
+    args = parser.parse_args()
+
+    try:
+        reader = TraceReader(args.trace)
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"Ошибка: {error}")
+
+    with reader:
+        callbacks: List[Segment] = []
+        chart = None
+        if args.gantt:
+            end = args.end if args.end is not None else reader.end_tick
+            chart = GanttChart(reader.cpu_count, args.start, end + 1, args.width)
+            callbacks.append(chart.add)
+
+        segments_file = open(args.segments, "w", newline="") if args.segments else None
+        if segments_file is not None:
+            writer = csv.writer(segments_file)
+            writer.writerow(["core", "pid", "start", "end"])
+            callbacks.append(lambda core, pid, start, end: writer.writerow((core, pid, start, end)))
+
+        def on_segment(core: int, pid: int, start: int, end: int) -> None:
+            for callback in callbacks:
+                callback(core, pid, start, end)
+
+        try:
+            summary = analyze(reader, on_segment if callbacks else None)
+        finally:
+            if segments_file is not None:
+                segments_file.close()
+
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    if chart is not None:
+        print("\n".join(chart.render()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,68 @@
+import asyncio
 import os
-import time
+import shutil
+import sys
 import threading
+from typing import List, Optional
+
 from .os import OperatingSystem
+from .runtime import AsyncRuntime
+from .services.snapshot import SystemSnapshot
+
+# Управляющие последовательности ANSI: очистка экрана, позиционирование курсора, очистка до конца строки
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+CLEAR_LINE = "\x1b[K"
+
+if os.name == 'nt':
+    os.system('')  # включает обработку ANSI-последовательностей в консоли Windows
+
+
+def _speed(stats) -> str:
+    # Заданная скорость и фактическая частота тактов за последнюю секунду
+    pacing = stats.get('pacing')
+    if pacing is None:
+        return f"{stats['speed_hz']} такт/сек"
+    return f"{stats['speed_hz']} такт/сек (факт. {pacing['achieved_hz']})"
 
 class CLI:
+    HELP = ("\nДоступные команды:\n"
+            "  create <size> [priority] [cores] - Создать процесс с размером <size> и приоритетом (меньше - важнее),\n"
+            "                  cores - разрешённые ядра через запятую (например, 0,2).\n"
+            "  speed+<N>%    - Увеличить скорость на N процентов (например, speed+10%).\n"
+            "  speed-<N>%    - Уменьшить скорость на N процентов (например, speed-5%).\n"
+            "  exit          - Завершить работу эмулятора.\n"
+            "  <любая другая команда или Enter> - обновить статистику.\n")
+
     def __init__(self, os_instance: OperatingSystem):
         self.os = os_instance
         self._running = True
 
     def _display_stats(self):
-        stats = self.os.get_system_stats()
+        # Интерфейс читает только опубликованный снимок и не трогает живые объекты симуляции
+        snapshot = self.os.latest_snapshot()
+        stats = snapshot.stats
 
-        os.system('cls' if os.name == 'nt' else 'clear')
+        print(CLEAR_SCREEN, end="")
 
         print("--- Эмулятор Операционной Системы (Лаб. 4) ---")
         print(f"CPU: {stats['cpu_state']} | Активный PID: {stats['active_pid']} | Последняя команда: {stats['last_command']}")
-        print(f"Скорость: {stats['speed_hz']} такт/сек | Процессы: {stats['process_count']} | Заблокировано: {stats['blocked_count']}")
+        print(f"Скорость: {_speed(stats)} | Процессы: {stats['process_count']} | Заблокировано: {stats['blocked_count']}")
         print(f"Память: {stats['memory_usage']}")
+        if len(stats['cores']) > 1:
+            print("Ядра: " + " ".join(
+                f"[{core['core']}: {core['pid'] if core['pid'] is not None else '-'}/{core['ready']}]" for core in stats['cores']
+            ))
 
         print("\n--- Таблица Процессов (PSW) ---")
         print(f"{'PID':<5} | {'Состояние':<12} | {'PC':<7} | {'Тики':<5} | {'I/O':<5} | {'Размер':<7}")
         print("-" * 63)
 
-        if stats['all_processes']:
-            sorted_processes = sorted(stats['all_processes'], key=lambda p: p.pid)
-            for proc in sorted_processes:
+        if snapshot.processes:
+            for proc in snapshot.processes:
                 pid_str = str(proc.pid)
-                state_str = proc.state.value
+                state_str = proc.state
                 pc_str = str(proc.program_counter)
                 ticks_str = str(proc.ticks_worked_in_quantum)
                 io_timer_str = str(proc.io_time_remaining)
@@ -50,30 +86,35 @@ class CLI:
             return
 
         elif command == "help" or command == "/?":
-            print("\nДоступные команды:\n"
-                  "  create <size> - Создать процесс с размером <size> (целое число).\n"
-                  "  speed+<N>%    - Увеличить скорость на N процентов (например, speed+10%).\n"
-                  "  speed-<N>%    - Уменьшить скорость на N процентов (например, speed-5%).\n"
-                  "  exit          - Завершить работу эмулятора.\n"
-                  "  <любая другая команда или Enter> - обновить статистику.\n")
+            print(self.HELP)
             input("Нажмите Enter для продолжения...")
 
-        elif command == "create" and len(parts) > 1:
+        else:
+            result = self._run_command(parts)
+            if result:
+                input(f"\n> {result}\n\nНажмите Enter для продолжения...")
+
+        self._display_stats()
+
+    def _run_command(self, parts: List[str]) -> Optional[str]:
+        # Общие для всех интерфейсов команды; возвращают сообщение для пользователя
+        command = parts[0]
+        if command == "create" and len(parts) > 1:
             try:
                 size = int(parts[1])
-                result = self.os.create_new_process(size)
-                input(f"\n> {result}\n\nНажмите Enter для продолжения...")
+                priority = int(parts[2]) if len(parts) > 2 else 0
+                affinity = [int(core) for core in parts[3].split(",")] if len(parts) > 3 else None
             except ValueError:
-                input("\n> Ошибка: размер должен быть целым числом.\n\nНажмите Enter...")
+                return "Ошибка: размер, приоритет и номера ядер должны быть целыми числами."
+            return self.os.create_new_process(size, priority, affinity)
 
         elif command.startswith("speed+"):
-            self._change_speed_handler(command, increase=True)
+            return self._change_speed_handler(command, increase=True)
         elif command.startswith("speed-"):
-            self._change_speed_handler(command, increase=False)
-
-        self._display_stats()
+            return self._change_speed_handler(command, increase=False)
+        return None
 
-    def _change_speed_handler(self, command: str, increase: bool):
+    def _change_speed_handler(self, command: str, increase: bool) -> Optional[str]:
         try:
             op = "speed+" if increase else "speed-"
             val_str = command.replace(op, "").replace("%", "")
@@ -81,7 +122,8 @@ class CLI:
             factor = (1 + percentage / 100.0) if increase else (1 - percentage / 100.0)
             self.os.change_speed(factor)
         except (ValueError, IndexError):
-            input(f"\n> Ошибка формата. Используйте: speed+/-<N>%.\n\nНажмите Enter...")
+            return "Ошибка формата. Используйте: speed+/-<N>%."
+        return None
 
     def start(self):
         os_thread = threading.Thread(target=self.os.boot, name="OSThread")
@@ -100,3 +142,178 @@ class CLI:
         if self._running:
             self._running = False
             self.os.shutdown()
+
+
+class Dashboard(CLI):
+    # Живая панель: обновляется по таймеру из последнего снимка, перерисовывает только изменившиеся
+    # строки и показывает таблицу процессов постранично, ввод команд не блокирует обновление
+    HELP = "create <size> [priority] [cores] | speed+N% | speed-N% | n/p/page <N> - страницы | exit"
+
+    def __init__(self, os_instance: OperatingSystem, refresh_interval: float = 0.25):
+        super().__init__(os_instance)
+        self.refresh_interval: float = refresh_interval
+        self.page: int = 0
+        self.status: str = "Введите 'help' для списка команд."
+        self._screen: List[str] = []
+        self._shown_version: int = -1
+        self._render_lock = threading.Lock()
+        self._refresh_now = threading.Event()
+
+    def _frame(self, snapshot: SystemSnapshot, width: int, height: int) -> List[str]:
+        stats = snapshot.stats
+        lines = [
+            "--- Эмулятор Операционной Системы (Лаб. 4) ---",
+            f"Такт: {snapshot.tick} | CPU: {stats['cpu_state']} | Активный PID: {stats['active_pid']} | "
+            f"Последняя команда: {stats['last_command']}",
+            f"Скорость: {_speed(stats)} | Процессы: {stats['process_count']} | "
+            f"Заблокировано: {stats['blocked_count']} | Завершено: {stats['completed']}",
+            f"Память: {stats['memory_usage']}",
+        ]
+        if len(stats['cores']) > 1:
+            lines.append("Ядра: " + " ".join(
+                f"[{core['core']}: {core['pid'] if core['pid'] is not None else '-'}/{core['ready']}]" for core in stats['cores']
+            ))
+        lines.append(f"{'PID':<5} | {'Состояние':<12} | {'PC':<7} | {'Тики':<5} | {'I/O':<5} | {'Размер':<7}")
+        lines.append("-" * 63)
+
+        # Форматируются только строки текущей страницы - размер таблицы не влияет на стоимость кадра
+        processes = snapshot.processes
+        rows_per_page = max(1, height - len(lines) - 3)
+        pages = max(1, -(-len(processes) // rows_per_page))
+        self.page = min(self.page, pages - 1)
+        start = self.page * rows_per_page
+        for proc in processes[start:start + rows_per_page]:
+            lines.append(f"{proc.pid:<5} | {proc.state:<12} | {proc.program_counter:<7} | "
+                         f"{proc.ticks_worked_in_quantum:<5} | {proc.io_time_remaining:<5} | {proc.size:<7}")
+        if not processes:
+            lines.append("В системе нет процессов.")
+        lines.extend([""] * (height - 3 - len(lines)))
+
+        lines.append("-" * 63)
+        lines.append(f"Страница {self.page + 1}/{pages} | Процессов: {len(processes)}")
+        lines.append(self.status)
+        return [line[:width] for line in lines]
+
+    def _render(self, full: bool = False) -> None:
+        with self._render_lock:
+            snapshot = self.os.latest_snapshot()
+            size = shutil.get_terminal_size()
+            frame = self._frame(snapshot, size.columns, size.lines - 1)
+
+            if full or len(frame) != len(self._screen):
+                # Полная перерисовка; курсор остаётся в строке ввода под панелью
+                output = CLEAR_SCREEN + "\n".join(frame) + f"\x1b[{len(frame) + 1};1H> "
+            else:
+                changed = [f"\x1b[{row};1H{line}{CLEAR_LINE}"
+                           for row, (line, old) in enumerate(zip(frame, self._screen), start=1) if line != old]
+                if not changed:
+                    self._shown_version = snapshot.version
+                    return
+                output = SAVE_CURSOR + "".join(changed) + RESTORE_CURSOR
+
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            self._screen = frame
+            self._shown_version = snapshot.version
+
+    def _refresh_loop(self) -> None:
+        while self._running:
+            if self.os.latest_snapshot().version != self._shown_version:
+                self._render()
+            self._refresh_now.wait(self.refresh_interval)
+            self._refresh_now.clear()
+
+    def _handle_command(self, command_line: str):
+        parts = command_line.strip().lower().split()
+        command = parts[0] if parts else ""
+
+        if command == "exit":
+            self.stop()
+            return
+        elif command in ("help", "/?"):
+            self.status = self.HELP
+        elif command in ("n", "next"):
+            self.page += 1
+        elif command in ("p", "prev"):
+            self.page = max(0, self.page - 1)
+        elif command == "page" and len(parts) > 1 and parts[1].isdigit():
+            self.page = max(0, int(parts[1]) - 1)
+        elif parts:
+            self.status = self._run_command(parts) or f"Выполнено: {command_line.strip()}"
+
+        self._render(full=True)
+
+    def start(self):
+        # Сообщения загрузки не выводятся - они испортили бы панель
+        os_thread = threading.Thread(target=self.os.boot, kwargs={"verbose": False}, name="OSThread")
+        os_thread.daemon = True
+        os_thread.start()
+
+        refresh_thread = threading.Thread(target=self._refresh_loop, name="DashboardThread")
+        refresh_thread.daemon = True
+
+        self._render(full=True)
+        refresh_thread.start()
+        while self._running:
+            try:
+                command = input()
+                self._handle_command(command)
+            except (KeyboardInterrupt, EOFError):
+                self.stop()
+        self._refresh_now.set()
+        print()
+
+
+class AsyncCLI(CLI):
+    # Построчный интерфейс поверх AsyncRuntime. Фоновый поток только читает строки ввода и передаёт
+    # их в цикл событий; команды выполняются в цикле симуляции через очередь runtime
+    def __init__(self, runtime: AsyncRuntime):
+        super().__init__(runtime.os)
+        self.runtime = runtime
+
+    @staticmethod
+    def _read_lines(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue) -> None:
+        try:
+            for line in sys.stdin:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            loop.call_soon_threadsafe(lines.put_nowait, None)
+        except RuntimeError:
+            pass  # цикл событий уже закрыт
+
+    async def _interact(self) -> None:
+        lines: asyncio.Queue = asyncio.Queue()
+        reader = threading.Thread(target=self._read_lines, args=(asyncio.get_running_loop(), lines), name="InputThread")
+        reader.daemon = True
+        reader.start()
+
+        # Даёт runtime загрузить начальные задачи и опубликовать первый снимок
+        await asyncio.sleep(0)
+        self._display_stats()
+        while self._running:
+            line = await lines.get()
+            if line is None:
+                self.stop()
+                break
+
+            parts = line.strip().lower().split()
+            if parts and parts[0] == "exit":
+                self.stop()
+                break
+
+            result = None
+            if parts and parts[0] not in ("help", "/?"):
+                result = await self.runtime.submit(lambda os_emulator: self._run_command(parts))
+            self._display_stats()
+            if parts and parts[0] in ("help", "/?"):
+                print(self.HELP)
+            elif result:
+                print(f"> {result}")
+
+    async def _main(self) -> None:
+        await asyncio.gather(self.runtime.run(), self._interact())
+
+    def start(self):
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            self.stop()